@@ -0,0 +1,30 @@
+"""
+APIRoute that decodes JSON request bodies with orjson instead of the stdlib json module.
+"""
+
+from typing import Any, Callable
+
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRequest(Request):
+    """Request whose json() is decoded with orjson."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route class that hands ORJSONRequest objects to FastAPI's body parsing."""
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
@@ -1,9 +1,13 @@
+import asyncio
+import contextlib
 import time
+from typing import AsyncIterator, Callable
+import orjson
 import structlog
-import httpx
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.sse import EventSourceResponse, ServerSentEvent
 
+from app.api.orjson_route import ORJSONRoute
 from app.models.email import (
     EmailGenerationRequest,
     EmailGenerationResponse,
@@ -13,18 +17,21 @@ from app.models.email import (
     EmailEvaluationResponse,
     MetricScoreResponse,
     ErrorResponse,
+    UsageInfo,
 )
 from app.services.llm_service import get_llm_service
 from app.services.email_pipeline import get_email_pipeline
-from app.evaluation.evaluation_service import get_evaluation_service
-from app.evaluation.test_cases import get_all_test_cases, get_test_case_by_id
-from app.evaluation.metrics import EVALUATION_CRITERIA
+from app.services.http_client import get_http_client
+from app.services.response_cache import ResponseCache, make_cache_key
 from app.config import get_settings
 
 
 logger = structlog.get_logger()
 
-router = APIRouter(prefix="/api", tags=["email"])
+# Request bodies are decoded with orjson; response_model routes are already
+# encoded by pydantic-core (FastAPI's dump_json fast path), so the default
+# response class is kept rather than the deprecated ORJSONResponse.
+router = APIRouter(prefix="/api", tags=["email"], route_class=ORJSONRoute)
 
 # All supported models (backend - kept for future use)
 # Pricing per 1M tokens (input/output) from OpenRouter
@@ -48,50 +55,89 @@ UI_VISIBLE_MODELS = [
 # Model pricing lookup (cost per 1M tokens)
 MODEL_PRICING = {model["id"]: {"input": model["input_cost"], "output": model["output_cost"]} for model in POPULAR_MODELS}
 
+# Admission control and response cache for LLM-backed endpoints
+_settings = get_settings()
+_LLM_SEM = asyncio.Semaphore(_settings.max_concurrent_llm)
+_response_cache = ResponseCache(
+    maxsize=_settings.response_cache_size,
+    ttl_seconds=_settings.response_cache_ttl_seconds,
+)
 
-@router.post(
-    "/generate-email",
-    response_model=EmailGenerationResponse,
-    responses={
-        500: {"model": ErrorResponse, "description": "LLM service error"},
-        503: {"model": ErrorResponse, "description": "Service unavailable"},
-    },
-    summary="Generate an email",
-    description="Generate a professional email with automatic quality evaluation and compliance checking.",
+# Metric fields shared by EvaluationMetrics and EmailEvaluationResponse
+_METRIC_FIELDS = tuple(
+    name for name, field in EmailEvaluationResponse.model_fields.items()
+    if field.annotation is MetricScoreResponse
 )
-async def generate_email(request: EmailGenerationRequest) -> EmailGenerationResponse:
-    """
-    Generate an email with full quality pipeline:
-    1. Generate initial email with compliance rules
-    2. Evaluate against 10 quality metrics
-    3. Auto-refine if below threshold or compliance issues detected
-    4. Return final compliant email
-    """
+
+# Static model list payloads, serialized once at import
+_MODELS_JSON = orjson.dumps({
+    "models": UI_VISIBLE_MODELS,
+    "default": "openai/gpt-4o"
+})
+_MODELS_FALLBACK_JSON = orjson.dumps({
+    "models": POPULAR_MODELS,
+    "default": _settings.openrouter_model,
+    "source": "fallback"
+})
+
+# OpenRouter model catalog cache - the catalog changes rarely, so refetch at most every 10 minutes
+MODELS_CACHE_TTL_SECONDS = 600
+_models_cache: tuple[float, bytes] | None = None
+_models_cache_lock = asyncio.Lock()
+
+
+def _cached_copy(response):
+    """Copy of a cached response with zeroed usage, since serving it made no LLM call."""
+    return response.model_copy(update={"usage": UsageInfo()})
+
+
+async def _run_quality_pipeline(
+    request: EmailGenerationRequest,
+    label: str,
+    error_detail: str,
+) -> EmailGenerationResponse:
+    """Run the generate -> evaluate -> refine pipeline shared by the generation routes."""
+    # Field name -> value (Enums and ChatMessage objects kept as-is); names match the pipeline kwargs
+    fields = dict(request)
+    details = fields["details"]
+    history = fields["history"]
+    log = logger.bind(route=label, model=fields["model"])
     start_time = time.time()
+    purpose_v = fields["purpose"].value
+    length_v = fields["length"].value
+    tone_v = fields["tone"].value if fields["tone"] else None
 
-    logger.info(
-        "Email generation request received (quality pipeline)",
-        purpose=request.purpose.value,
-        length=request.length.value,
-        tone=request.tone.value if request.tone else None,
-        model=request.model,
-        details_length=len(request.details),
+    log.info(
+        "Quality pipeline request received",
+        purpose=purpose_v,
+        length=length_v,
+        tone=tone_v,
+        details_length=len(details),
+    )
+
+    cache_key = make_cache_key(
+        "quality_pipeline",
+        purpose_v,
+        details,
+        length_v,
+        tone_v,
+        fields["model"],
+        [msg.model_dump() for msg in history],
     )
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        log.info("Serving cached email generation", cache_hits=_response_cache.hits)
+        return _cached_copy(cached)
 
     try:
         pipeline = get_email_pipeline()
-        response = await pipeline.generate_with_quality_check(
-            purpose=request.purpose,
-            details=request.details,
-            length=request.length,
-            tone=request.tone,
-            model=request.model,
-            history=request.history,
-        )
+        async with _LLM_SEM:
+            response = await pipeline.generate_with_quality_check(**fields)
+        _response_cache.set(cache_key, response)
 
         duration = time.time() - start_time
-        logger.info(
-            "Email generated successfully (quality pipeline)",
+        log.info(
+            "Quality pipeline completed",
             duration_seconds=round(duration, 2),
             total_cost=response.usage.cost if response.usage else 0,
         )
@@ -99,13 +145,34 @@ async def generate_email(request: EmailGenerationRequest) -> EmailGenerationResp
         return response
 
     except Exception as e:
-        logger.error("Email generation failed", error=str(e))
+        log.error("Quality pipeline failed", error=str(e))
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to generate email: {str(e)}"
+            detail=f"{error_detail}: {str(e)}"
         )
 
 
+@router.post(
+    "/generate-email",
+    response_model=EmailGenerationResponse,
+    responses={
+        500: {"model": ErrorResponse, "description": "LLM service error"},
+        503: {"model": ErrorResponse, "description": "Service unavailable"},
+    },
+    summary="Generate an email",
+    description="Generate a professional email with automatic quality evaluation and compliance checking.",
+)
+async def generate_email(request: EmailGenerationRequest) -> EmailGenerationResponse:
+    """
+    Generate an email with full quality pipeline:
+    1. Generate initial email with compliance rules
+    2. Evaluate against 10 quality metrics
+    3. Auto-refine if below threshold or compliance issues detected
+    4. Return final compliant email
+    """
+    return await _run_quality_pipeline(request, "generate_email", "Failed to generate email")
+
+
 @router.post(
     "/generate-email/quality",
     response_model=EmailGenerationResponse,
@@ -126,43 +193,10 @@ async def generate_email_with_quality(request: EmailGenerationRequest) -> EmailG
     The evaluation and refinement happen behind the scenes.
     User only receives the final quality-checked email.
     """
-    start_time = time.time()
-
-    logger.info(
-        "Quality pipeline request received",
-        purpose=request.purpose.value,
-        length=request.length.value,
-        tone=request.tone.value if request.tone else None,
-        model=request.model,
+    return await _run_quality_pipeline(
+        request, "generate_email_quality", "Failed to generate quality-checked email"
     )
 
-    try:
-        pipeline = get_email_pipeline()
-        response = await pipeline.generate_with_quality_check(
-            purpose=request.purpose,
-            details=request.details,
-            length=request.length,
-            tone=request.tone,
-            model=request.model,
-            history=request.history,
-        )
-
-        duration = time.time() - start_time
-        logger.info(
-            "Quality pipeline completed",
-            duration_seconds=round(duration, 2),
-            total_cost=response.usage.cost if response.usage else 0,
-        )
-
-        return response
-
-    except Exception as e:
-        logger.error("Quality pipeline failed", error=str(e))
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to generate quality-checked email: {str(e)}"
-        )
-
 
 @router.post(
     "/refine-email",
@@ -178,39 +212,94 @@ async def refine_email(request: EmailRefineRequest) -> EmailRefineResponse:
     """
     Refine an existing email based on user feedback.
     """
+    # Field names match the refine_email kwargs
+    fields = dict(request)
+    log = logger.bind(route="refine_email", model=fields["model"])
     start_time = time.time()
 
-    logger.info(
+    log.info(
         "Email refinement request received",
-        feedback_length=len(request.feedback),
-        original_subject_length=len(request.original_subject),
+        feedback_length=len(fields["feedback"]),
+        original_subject_length=len(fields["original_subject"]),
     )
 
+    cache_key = make_cache_key(
+        "refine",
+        fields["original_subject"],
+        fields["original_body"],
+        fields["feedback"],
+        fields["model"],
+        [msg.model_dump() for msg in fields["history"]],
+    )
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        log.info("Serving cached email refinement", cache_hits=_response_cache.hits)
+        return _cached_copy(cached)
+
     try:
         llm_service = get_llm_service()
-        response = await llm_service.refine_email(
-            original_subject=request.original_subject,
-            original_body=request.original_body,
-            feedback=request.feedback,
-            model=request.model,
-            history=request.history,
-        )
+        async with _LLM_SEM:
+            response = await llm_service.refine_email(**fields)
+        _response_cache.set(cache_key, response)
 
         duration = time.time() - start_time
-        logger.info("Email refined successfully", duration_seconds=round(duration, 2))
+        log.info("Email refined successfully", duration_seconds=round(duration, 2))
 
         return response
 
     except Exception as e:
-        logger.error("Email refinement failed", error=str(e))
+        log.error("Email refinement failed", error=str(e))
         raise HTTPException(
             status_code=500,
             detail=f"Failed to refine email: {str(e)}"
         )
 
 
+async def _relay_stream(
+    open_stream: Callable[[], AsyncIterator[str]],
+    log,
+    failure_event: str,
+) -> AsyncIterator[ServerSentEvent]:
+    """
+    Relay LLM chunks as SSE events.
+
+    A producer task drains the upstream stream into a bounded queue so network reads
+    overlap with sends to the client. The task (and the upstream request) is torn down
+    as soon as the client disconnects.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+
+    async def produce():
+        try:
+            async with _LLM_SEM:
+                async with contextlib.aclosing(open_stream()) as chunks:
+                    async for chunk in chunks:
+                        await queue.put(chunk)
+            await queue.put(None)
+        except Exception as e:
+            await queue.put(e)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                # Signal completion
+                yield ServerSentEvent(raw_data="[DONE]")
+                break
+            if isinstance(item, Exception):
+                log.error(failure_event, error=str(item))
+                yield ServerSentEvent(raw_data=f"[ERROR] {str(item)}")
+                break
+            # Send each chunk as SSE data
+            yield ServerSentEvent(raw_data=item)
+    finally:
+        producer.cancel()
+
+
 @router.post(
     "/generate-email/stream",
+    response_class=EventSourceResponse,
     summary="Generate an email with streaming",
     description="Generate a professional email with real-time streaming output.",
 )
@@ -218,46 +307,33 @@ async def generate_email_stream(request: EmailGenerationRequest):
     """
     Generate an email with streaming response for real-time output.
     """
-    logger.info(
+    fields = dict(request)
+    log = logger.bind(route="generate_email_stream", model=fields["model"])
+    purpose_v = fields["purpose"].value
+    length_v = fields["length"].value
+    tone_v = fields["tone"].value if fields["tone"] else None
+
+    log.info(
         "Streaming email generation request received",
-        purpose=request.purpose.value,
-        length=request.length.value,
-        tone=request.tone.value if request.tone else None,
-        model=request.model,
+        purpose=purpose_v,
+        length=length_v,
+        tone=tone_v,
     )
 
-    async def event_generator():
-        try:
-            llm_service = get_llm_service()
-            async for chunk in llm_service.generate_email_stream(
-                purpose=request.purpose,
-                details=request.details,
-                length=request.length,
-                tone=request.tone,
-                model=request.model,
-                history=request.history,
-            ):
-                # Send each chunk as SSE data
-                yield f"data: {chunk}\n\n"
-            # Signal completion
-            yield "data: [DONE]\n\n"
-        except Exception as e:
-            logger.error("Streaming email generation failed", error=str(e))
-            yield f"data: [ERROR] {str(e)}\n\n"
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        }
+    stream = _relay_stream(
+        lambda: get_llm_service().generate_email_stream(**fields),
+        log,
+        "Streaming email generation failed",
     )
+    # Close the relay (and cancel its producer) as soon as this route stops iterating
+    async with contextlib.aclosing(stream):
+        async for event in stream:
+            yield event
 
 
 @router.post(
     "/refine-email/stream",
+    response_class=EventSourceResponse,
     summary="Refine an email with streaming",
     description="Refine an existing email with real-time streaming output.",
 )
@@ -265,36 +341,22 @@ async def refine_email_stream(request: EmailRefineRequest):
     """
     Refine an email with streaming response for real-time output.
     """
-    logger.info(
+    fields = dict(request)
+    log = logger.bind(route="refine_email_stream", model=fields["model"])
+
+    log.info(
         "Streaming email refinement request received",
-        feedback_length=len(request.feedback),
+        feedback_length=len(fields["feedback"]),
     )
 
-    async def event_generator():
-        try:
-            llm_service = get_llm_service()
-            async for chunk in llm_service.refine_email_stream(
-                original_subject=request.original_subject,
-                original_body=request.original_body,
-                feedback=request.feedback,
-                model=request.model,
-                history=request.history,
-            ):
-                yield f"data: {chunk}\n\n"
-            yield "data: [DONE]\n\n"
-        except Exception as e:
-            logger.error("Streaming email refinement failed", error=str(e))
-            yield f"data: [ERROR] {str(e)}\n\n"
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        }
+    stream = _relay_stream(
+        lambda: get_llm_service().refine_email_stream(**fields),
+        log,
+        "Streaming email refinement failed",
     )
+    async with contextlib.aclosing(stream):
+        async for event in stream:
+            yield event
 
 
 @router.get(
@@ -306,7 +368,12 @@ async def health_check():
     """
     Health check endpoint.
     """
-    return {"status": "healthy", "service": "fmg-muse"}
+    return {
+        "status": "healthy",
+        "service": "fmg-muse",
+        "cache_hits": _response_cache.hits,
+        "cache_misses": _response_cache.misses,
+    }
 
 
 @router.get(
@@ -318,10 +385,7 @@ async def get_models():
     """
     Get the list of models visible in the UI dropdown.
     """
-    return {
-        "models": UI_VISIBLE_MODELS,
-        "default": "openai/gpt-4o"
-    }
+    return Response(_MODELS_JSON, media_type="application/json")
 
 
 @router.get(
@@ -332,11 +396,22 @@ async def get_models():
 async def get_all_models():
     """
     Fetch all available models from OpenRouter API dynamically.
+    Successful responses are cached for MODELS_CACHE_TTL_SECONDS.
     """
-    settings = get_settings()
+    global _models_cache
 
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+    if _models_cache and time.monotonic() - _models_cache[0] < MODELS_CACHE_TTL_SECONDS:
+        return Response(_models_cache[1], media_type="application/json")
+
+    async with _models_cache_lock:
+        # Another request may have refreshed the cache while we waited
+        if _models_cache and time.monotonic() - _models_cache[0] < MODELS_CACHE_TTL_SECONDS:
+            return Response(_models_cache[1], media_type="application/json")
+
+        settings = get_settings()
+
+        try:
+            client = get_http_client()
             response = await client.get(
                 f"{settings.openrouter_base_url}/models",
                 headers={
@@ -347,11 +422,7 @@ async def get_all_models():
 
             if response.status_code != 200:
                 logger.warning("Failed to fetch models from OpenRouter, using fallback list")
-                return {
-                    "models": POPULAR_MODELS,
-                    "default": settings.openrouter_model,
-                    "source": "fallback"
-                }
+                return Response(_MODELS_FALLBACK_JSON, media_type="application/json")
 
             data = response.json()
             models = []
@@ -363,19 +434,17 @@ async def get_all_models():
                     "provider": model_id.split("/")[0].title() if "/" in model_id else "Unknown"
                 })
 
-            return {
+            content = orjson.dumps({
                 "models": models,
                 "default": settings.openrouter_model,
                 "source": "openrouter"
-            }
+            })
+            _models_cache = (time.monotonic(), content)
+            return Response(content, media_type="application/json")
 
-    except Exception as e:
-        logger.error("Error fetching models from OpenRouter", error=str(e))
-        return {
-            "models": POPULAR_MODELS,
-            "default": settings.openrouter_model,
-            "source": "fallback"
-        }
+        except Exception as e:
+            logger.error("Error fetching models from OpenRouter", error=str(e))
+            return Response(_MODELS_FALLBACK_JSON, media_type="application/json")
 
 
 # ============== Evaluation Endpoints ==============
@@ -405,88 +474,50 @@ async def evaluate_email(request: EmailEvaluationRequest) -> EmailEvaluationResp
     - Risk Balance: Balanced benefit/risk presentation
     - Disclaimer Accuracy: Appropriate disclaimers present
     """
+    log = logger.bind(route="evaluate_email", model=request.model)
     start_time = time.time()
+    purpose_v = request.purpose.value
+    tone_v = request.tone.value
+    length_v = request.length.value
 
-    logger.info(
+    log.info(
         "Email evaluation request received",
-        purpose=request.purpose.value,
-        tone=request.tone.value,
-        length=request.length.value,
+        purpose=purpose_v,
+        tone=tone_v,
+        length=length_v,
         subject_length=len(request.subject),
     )
 
+    from app.evaluation.evaluation_service import get_evaluation_service
+
     try:
         eval_service = get_evaluation_service()
-        metrics = await eval_service.evaluate_email(
-            email_subject=request.subject,
-            email_body=request.body,
-            purpose=request.purpose,
-            tone=request.tone,
-            length=request.length,
-            original_request=request.original_request,
-            model=request.model,
-        )
+        async with _LLM_SEM:
+            metrics = await eval_service.evaluate_email(
+                email_subject=request.subject,
+                email_body=request.body,
+                purpose=request.purpose,
+                tone=request.tone,
+                length=request.length,
+                original_request=request.original_request,
+                model=request.model,
+            )
 
         duration = time.time() - start_time
-        logger.info(
+        log.info(
             "Email evaluation completed",
             duration_seconds=round(duration, 2),
             overall_score=metrics.overall_score,
             pass_threshold=metrics.pass_threshold,
         )
 
-        # Convert to response model
-        return EmailEvaluationResponse(
-            compliance=MetricScoreResponse(
-                score=metrics.compliance.score,
-                justification=metrics.compliance.justification,
-                suggestions=metrics.compliance.suggestions,
-            ),
-            tone_consistency=MetricScoreResponse(
-                score=metrics.tone_consistency.score,
-                justification=metrics.tone_consistency.justification,
-                suggestions=metrics.tone_consistency.suggestions,
-            ),
-            length_accuracy=MetricScoreResponse(
-                score=metrics.length_accuracy.score,
-                justification=metrics.length_accuracy.justification,
-                suggestions=metrics.length_accuracy.suggestions,
-            ),
-            structure_completeness=MetricScoreResponse(
-                score=metrics.structure_completeness.score,
-                justification=metrics.structure_completeness.justification,
-                suggestions=metrics.structure_completeness.suggestions,
-            ),
-            purpose_alignment=MetricScoreResponse(
-                score=metrics.purpose_alignment.score,
-                justification=metrics.purpose_alignment.justification,
-                suggestions=metrics.purpose_alignment.suggestions,
-            ),
-            clarity=MetricScoreResponse(
-                score=metrics.clarity.score,
-                justification=metrics.clarity.justification,
-                suggestions=metrics.clarity.suggestions,
-            ),
-            professionalism=MetricScoreResponse(
-                score=metrics.professionalism.score,
-                justification=metrics.professionalism.justification,
-                suggestions=metrics.professionalism.suggestions,
-            ),
-            personalization=MetricScoreResponse(
-                score=metrics.personalization.score,
-                justification=metrics.personalization.justification,
-                suggestions=metrics.personalization.suggestions,
-            ),
-            risk_balance=MetricScoreResponse(
-                score=metrics.risk_balance.score,
-                justification=metrics.risk_balance.justification,
-                suggestions=metrics.risk_balance.suggestions,
-            ),
-            disclaimer_accuracy=MetricScoreResponse(
-                score=metrics.disclaimer_accuracy.score,
-                justification=metrics.disclaimer_accuracy.justification,
-                suggestions=metrics.disclaimer_accuracy.suggestions,
-            ),
+        # Convert to response model (scores were already validated by the evaluation service)
+        scores = {
+            name: MetricScoreResponse.model_construct(**vars(getattr(metrics, name)))
+            for name in _METRIC_FIELDS
+        }
+        return EmailEvaluationResponse.model_construct(
+            **scores,
             overall_score=metrics.overall_score,
             pass_threshold=metrics.pass_threshold,
             strengths=metrics.strengths,
@@ -495,7 +526,7 @@ async def evaluate_email(request: EmailEvaluationRequest) -> EmailEvaluationResp
         )
 
     except Exception as e:
-        logger.error("Email evaluation failed", error=str(e))
+        log.error("Email evaluation failed", error=str(e))
         raise HTTPException(
             status_code=500,
             detail=f"Failed to evaluate email: {str(e)}"
@@ -511,22 +542,9 @@ async def get_test_cases():
     """
     Get all ideal test case emails that serve as reference examples.
     """
-    test_cases = get_all_test_cases()
-    return {
-        "count": len(test_cases),
-        "test_cases": [
-            {
-                "id": tc["id"],
-                "purpose": tc["purpose"].value,
-                "tone": tc["tone"].value,
-                "length": tc["length"].value,
-                "input_details": tc["input_details"],
-                "ideal_email": tc["ideal_email"],
-                "evaluation_notes": tc["evaluation_notes"],
-            }
-            for tc in test_cases
-        ]
-    }
+    from app.evaluation.test_cases import TEST_CASES_JSON
+
+    return Response(TEST_CASES_JSON, media_type="application/json")
 
 
 @router.get(
@@ -538,19 +556,13 @@ async def get_test_case(case_id: str):
     """
     Get a specific test case by its ID.
     """
-    test_case = get_test_case_by_id(case_id)
-    if not test_case:
+    from app.evaluation.test_cases import TEST_CASE_BY_ID_JSON
+
+    test_case_json = TEST_CASE_BY_ID_JSON.get(case_id)
+    if test_case_json is None:
         raise HTTPException(status_code=404, detail=f"Test case {case_id} not found")
 
-    return {
-        "id": test_case["id"],
-        "purpose": test_case["purpose"].value,
-        "tone": test_case["tone"].value,
-        "length": test_case["length"].value,
-        "input_details": test_case["input_details"],
-        "ideal_email": test_case["ideal_email"],
-        "evaluation_notes": test_case["evaluation_notes"],
-    }
+    return Response(test_case_json, media_type="application/json")
 
 
 @router.get(
@@ -562,16 +574,6 @@ async def get_evaluation_metrics():
     """
     Get the evaluation criteria, weights, and scoring guides.
     """
-    return {
-        "metrics": {
-            name: {
-                "name": criteria["name"],
-                "weight": criteria["weight"],
-                "description": criteria["description"],
-                "scoring_guide": criteria["scoring_guide"],
-            }
-            for name, criteria in EVALUATION_CRITERIA.items()
-        },
-        "pass_threshold": 7.0,
-        "total_weight": sum(c["weight"] for c in EVALUATION_CRITERIA.values()),
-    }
+    from app.evaluation.metrics import EVALUATION_METRICS_PAYLOAD
+
+    return Response(EVALUATION_METRICS_PAYLOAD, media_type="application/json")
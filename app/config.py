@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -7,6 +10,19 @@ class Settings(BaseSettings):
     openrouter_base_url: str = "https://openrouter.ai/api/v1"
     openrouter_model: str = "openai/gpt-4o"
 
+    # Evaluation: "parallel" scores each metric in its own concurrent call (lowest latency),
+    # "batched" scores all metrics in one structured-output call (fewest prompt tokens)
+    eval_mode: Literal["parallel", "batched"] = "parallel"
+    # Score compliance 2 without asking the LLM when the email uses prohibited phrases
+    # affirmatively ("guaranteed returns", "act now"); in "parallel" mode the compliance
+    # call is skipped, the other metrics are still scored by the LLM
+    eval_compliance_precheck: bool = False
+
+    # LLM request handling
+    max_concurrent_llm: int = 8
+    response_cache_size: int = 256
+    response_cache_ttl_seconds: int = 600
+
     # Application
     log_level: str = "INFO"
     debug: bool = False
@@ -17,10 +33,6 @@ class Settings(BaseSettings):
 
 
 # Create a single instance to avoid re-reading .env on every call
-_settings = None
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
@@ -1,21 +1,29 @@
 """Email evaluation module for quality assessment and improvement."""
 
-from app.evaluation.test_cases import (
-    IDEAL_TEST_CASES,
-    get_test_case_by_id,
-    get_test_cases_by_purpose,
-    get_test_cases_by_tone,
-    get_all_test_cases,
-)
-from app.evaluation.metrics import (
-    EvaluationMetrics,
-    MetricScore,
-    EVALUATION_CRITERIA,
-)
-from app.evaluation.evaluation_service import (
-    EmailEvaluationService,
-    get_evaluation_service,
-)
+import importlib
+
+# Exports are resolved on first access so that importing app.evaluation.test_cases
+# (needed by generation prompts) does not load the evaluation service and metrics.
+_EXPORTS = {
+    "IDEAL_TEST_CASES": "app.evaluation.test_cases",
+    "get_test_case_by_id": "app.evaluation.test_cases",
+    "get_test_cases_by_purpose": "app.evaluation.test_cases",
+    "get_test_cases_by_tone": "app.evaluation.test_cases",
+    "get_all_test_cases": "app.evaluation.test_cases",
+    "EvaluationMetrics": "app.evaluation.metrics",
+    "MetricScore": "app.evaluation.metrics",
+    "EVALUATION_CRITERIA": "app.evaluation.metrics",
+    "EmailEvaluationService": "app.evaluation.evaluation_service",
+    "get_evaluation_service": "app.evaluation.evaluation_service",
+}
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
 
 __all__ = [
     "IDEAL_TEST_CASES",
@@ -3,17 +3,24 @@ LLM-based email evaluation service.
 Uses the same LLM to score generated emails against quality metrics.
 """
 
-import structlog
-import json
+import asyncio
+import heapq
 import re
-from typing import Optional
+import structlog
+from operator import itemgetter
+from typing import Optional, Union
 
-from app.models.email import PurposeEnum, ToneEnum, LengthEnum
+import orjson
+
+from app.models.email import PurposeEnum, ToneEnum, LengthEnum, EmailEvaluationRequest
 from app.evaluation.metrics import (
     EvaluationMetrics,
     MetricScore,
     EVALUATION_CRITERIA,
+    METRIC_NAMES,
+    METRIC_WEIGHT_BY_NAME,
     calculate_overall_score,
+    score_length_accuracy,
 )
 from app.evaluation.test_cases import (
     get_conversations_by_purpose,
@@ -21,6 +28,8 @@ from app.evaluation.test_cases import (
     format_conversation_for_prompt,
 )
 from app.config import get_settings
+from app.services.http_client import LLM_TIMEOUT, get_http_client
+from app.services.response_cache import ResponseCache, make_cache_key
 
 logger = structlog.get_logger()
 
@@ -28,58 +37,102 @@ logger = structlog.get_logger()
 # GPT-4o-mini is ~3-5s vs GPT-4o ~10-15s
 EVALUATION_MODEL = "openai/gpt-4o-mini"
 
+# Let OpenRouter pick the lowest-latency healthy provider for the evaluation model
+EVALUATION_PROVIDER_PREFERENCES = {"sort": "latency", "allow_fallbacks": True}
+
+# Number of evaluation results kept in memory for repeated identical inputs
+EVALUATION_CACHE_SIZE = 1024
+
+# Output token caps: a full batched evaluation with terse fields fits well under 900 tokens,
+# a single metric under 150
+BATCHED_MAX_TOKENS = 900
+METRIC_MAX_TOKENS = 150
+
+# Cap on in-flight metric calls per evaluation in "parallel" mode (keeps us within OpenRouter rate limits)
+MAX_CONCURRENT_METRIC_CALLS = 6
+
+# Cap on LLM calls in flight for the whole of an evaluate_email_batch run (bulk/regression
+# scoring); batch items always use the single-prompt evaluation, so this is one call per email
+MAX_CONCURRENT_BATCH_EVALUATIONS = 4
+
+# Metrics scored deterministically in code rather than by the LLM
+LOCAL_METRICS = frozenset({"length_accuracy"})
+LLM_METRIC_NAMES = tuple(name for name in METRIC_NAMES if name not in LOCAL_METRICS)
+# Metrics still sent to the LLM in "parallel" mode once the compliance pre-check has fired
+_PRECHECKED_METRIC_NAMES = tuple(name for name in LLM_METRIC_NAMES if name != "compliance")
+
+# Unambiguous compliance violations (see EVALUATION_CRITERIA["compliance"]["check_points"]),
+# as (label, pattern) pairs matched against lowercased text on word boundaries
+COMPLIANCE_TRIGGER_PATTERNS = tuple(
+    (label, re.compile(pattern))
+    for label, pattern in (
+        ("guaranteed", r"\bguaranteed\b"),
+        ("risk-free", r"\brisk[-\s]free\b"),
+        ("cannot lose", r"\b(?:cannot|can[’']t)\s+lose\b"),
+        ("act now", r"\bact\s+now\b"),
+        ("limited time", r"\b(?:for\s+a\s+limited\s+time|limited[-\s]time\s+(?:offer|only|deal|opportunity))\b"),
+        ("last chance", r"\blast\s+chance\b"),
+        ("will definitely", r"\bwill\s+definitely\b"),
+    )
+)
 
-def build_evaluation_prompt(
-    email_subject: str,
-    email_body: str,
-    purpose: PurposeEnum,
-    tone: ToneEnum,
-    length: LengthEnum,
-    original_request: str,
-) -> str:
-    """Construct the prompt for LLM-based email evaluation."""
-
-    # Get relevant conversations for context
-    reference_conversations = get_conversations_by_purpose(purpose)
-    reference_conv = reference_conversations[0] if reference_conversations else None
-    reference_email = extract_email_from_conversation(reference_conv) if reference_conv else None
-
-    # Build the evaluation prompt
-    prompt = f"""You are an expert email quality evaluator for financial advisor communications.
-Evaluate the following generated email against strict quality and compliance standards.
-
-=== EMAIL TO EVALUATE ===
-Subject: {email_subject}
-
-{email_body}
-
-=== ORIGINAL REQUEST ===
-Purpose: {purpose.value}
-Requested Tone: {tone.value}
-Requested Length: {length.value}
-User's Input: {original_request}
-
-=== LENGTH TARGETS ===
-- Short: 50-100 words, 2-4 sentences
-- Medium: 100-200 words, 5-8 sentences
-- Long: 200-400 words, 9-15 sentences
+# A trigger is only a promise when its own clause carries no negation
+# ("returns cannot be guaranteed", "not FDIC insured or bank guaranteed")
+_CLAUSE_BOUNDARY_RE = re.compile(r"[.!?;:,\n]|\bbut\b")
+_NEGATION_RE = re.compile(r"\b(?:not|no|never|nothing|none|neither|nor|cannot|without)\b|n[’']t\b")
+# "guaranteed" attributed to a deposit insurer describes coverage, not a return promise
+_THIRD_PARTY_GUARANTOR_RE = re.compile(r"\b(?:fdic|federally|government)\b")
+# How far back to look for the start of the trigger's clause
+_CLAUSE_LOOKBACK = 200
+
+# Structured output schemas - the model must return exactly these JSON objects, with no fences or prose
+_METRIC_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "score": {"type": "integer"},
+        "justification": {"type": "string"},
+        "suggestions": {"type": ["string", "null"]},
+    },
+    "required": ["score", "justification", "suggestions"],
+    "additionalProperties": False,
+}
 
-"""
+METRIC_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "metric_score", "strict": True, "schema": _METRIC_SCHEMA},
+}
 
-    if reference_email and reference_conv:
-        prompt += f"""=== REFERENCE EXAMPLE (for comparison) ===
-This is an ideal email for a similar purpose:
+EVALUATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "email_evaluation",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                **{name: _METRIC_SCHEMA for name in LLM_METRIC_NAMES},
+                "strengths": {"type": "array", "items": {"type": "string"}},
+                "improvements_needed": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": [*LLM_METRIC_NAMES, "strengths", "improvements_needed"],
+            "additionalProperties": False,
+        },
+    },
+}
 
-Subject: {reference_email["subject"]}
 
-{reference_email["body"]}
+EVALUATION_SYSTEM_PROMPT = "You are an expert email quality evaluator. Always respond with valid JSON."
 
-Quality notes about the reference:
-{chr(10).join('- ' + note for note in reference_conv.get("evaluation_notes", []))}
+# Prompt caching: OpenRouter forwards cache_control to providers that need explicit
+# breakpoints (Anthropic); OpenAI models cache identical prefixes automatically.
+# Either way the invariant content must come first and be byte-identical across calls.
+_CACHE_CONTROL = {"type": "ephemeral"}
 
-"""
+_STATIC_RUBRIC_PREFIX = """You are an expert email quality evaluator for financial advisor communications.
+Evaluate the generated email at the end of this message against strict quality and compliance standards.
+(Length is checked separately and is not scored here.)
 
-    prompt += """=== EVALUATION CRITERIA ===
+=== EVALUATION CRITERIA ===
 Score each metric from 1-10 using these standards:
 
 1. COMPLIANCE (Weight: 20%)
@@ -99,11 +152,7 @@ Score each metric from 1-10 using these standards:
    - Friendly: Warm, personable, conversational
    - Casual: Relaxed, contractions okay
 
-3. LENGTH_ACCURACY (Weight: 8%)
-   Is the email within the target word count?
-   Count the body words (excluding subject).
-
-4. STRUCTURE_COMPLETENESS (Weight: 10%)
+3. STRUCTURE_COMPLETENESS (Weight: 10%)
    Check for:
    - Clear subject line
    - Appropriate greeting
@@ -111,41 +160,39 @@ Score each metric from 1-10 using these standards:
    - Clear closing
    - Signature placeholder
 
-5. PURPOSE_ALIGNMENT (Weight: 15%)
+4. PURPOSE_ALIGNMENT (Weight: 15%)
    Does the email achieve its stated purpose?
 
-6. CLARITY (Weight: 10%)
+5. CLARITY (Weight: 10%)
    Is the language clear and easy to understand?
    - Concise sentences
    - Logical flow
    - No ambiguity
 
-7. PROFESSIONALISM (Weight: 10%)
+6. PROFESSIONALISM (Weight: 10%)
    Is it appropriate for financial advisor communications?
    - Proper vocabulary
    - Respectful tone
    - Good grammar
 
-8. PERSONALIZATION (Weight: 7%)
+7. PERSONALIZATION (Weight: 7%)
    Are placeholders used correctly?
    - [Recipient Name], [Your Name], etc.
    - No made-up specific details
 
-9. RISK_BALANCE (Weight: 5%)
+8. RISK_BALANCE (Weight: 5%)
    If investments discussed, are risks and benefits balanced?
    (Score 8 if not applicable)
 
-10. DISCLAIMER_ACCURACY (Weight: 5%)
-    Are required disclaimers present when needed?
-    (Score 8 if no disclaimers needed)
+9. DISCLAIMER_ACCURACY (Weight: 5%)
+   Are required disclaimers present when needed?
+   (Score 8 if no disclaimers needed)
 
 === OUTPUT FORMAT ===
-Respond with a JSON object in exactly this format:
-```json
+Respond with only a JSON object in exactly this format:
 {
   "compliance": {"score": X, "justification": "...", "suggestions": "..."},
   "tone_consistency": {"score": X, "justification": "...", "suggestions": "..."},
-  "length_accuracy": {"score": X, "justification": "...", "suggestions": "..."},
   "structure_completeness": {"score": X, "justification": "...", "suggestions": "..."},
   "purpose_alignment": {"score": X, "justification": "...", "suggestions": "..."},
   "clarity": {"score": X, "justification": "...", "suggestions": "..."},
@@ -156,57 +203,350 @@ Respond with a JSON object in exactly this format:
   "strengths": ["strength1", "strength2", "strength3"],
   "improvements_needed": ["improvement1", "improvement2"]
 }
-```
 
 IMPORTANT:
 - Each score must be an integer from 1-10
-- Justification should be 1-2 sentences explaining the score
-- Suggestions should be specific and actionable (or null if score is 8+)
+- Justification: at most 12 words explaining the score
+- Suggestions: at most 15 words, specific and actionable (null if score is 8+)
 - List 2-4 strengths and 1-3 improvements
 - Be strict but fair in your evaluation
 
+"""
+
+
+def _build_reference_block(purpose: PurposeEnum) -> str:
+    """Render the reference example block for a purpose ("" if none exists)."""
+    reference_conversations = get_conversations_by_purpose(purpose)
+    reference_conv = reference_conversations[0] if reference_conversations else None
+    reference_email = extract_email_from_conversation(reference_conv) if reference_conv else None
+
+    if not (reference_email and reference_conv):
+        return ""
+
+    return f"""=== REFERENCE EXAMPLE (for comparison) ===
+This is an ideal email for a similar purpose:
+
+Subject: {reference_email["subject"]}
+
+{reference_email["body"]}
+
+Quality notes about the reference:
+{chr(10).join('- ' + note for note in reference_conv.get("evaluation_notes", []))}
+
+"""
+
+
+_REFERENCE_BLOCK_BY_PURPOSE: dict[PurposeEnum, str] = {
+    purpose: _build_reference_block(purpose) for purpose in PurposeEnum
+}
+
+# Rubric + reference example never change for a purpose, so the whole cacheable
+# prefix is rendered once per purpose at import
+_EVALUATION_PREFIX_BY_PURPOSE: dict[PurposeEnum, str] = {
+    purpose: _STATIC_RUBRIC_PREFIX + reference
+    for purpose, reference in _REFERENCE_BLOCK_BY_PURPOSE.items()
+}
+
+
+def build_dynamic_suffix(
+    email_subject: str,
+    email_body: str,
+    purpose: PurposeEnum,
+    tone: ToneEnum,
+    length: LengthEnum,
+    original_request: str,
+) -> str:
+    """Construct the per-request part of the evaluation prompt (email + original request)."""
+    return f"""=== EMAIL TO EVALUATE ===
+Subject: {email_subject}
+
+{email_body}
+
+=== ORIGINAL REQUEST ===
+Purpose: {purpose.value}
+Requested Tone: {tone.value}
+Requested Length: {length.value}
+User's Input: {original_request}
+
 Evaluate the email now:"""
 
-    return prompt
+
+def build_evaluation_content(
+    email_subject: str,
+    email_body: str,
+    purpose: PurposeEnum,
+    tone: ToneEnum,
+    length: LengthEnum,
+    original_request: str,
+) -> list[dict]:
+    """
+    Construct the evaluation prompt as user message content parts.
+    The rubric and reference example form a cacheable prefix; only the last part varies.
+    """
+    return [
+        {
+            "type": "text",
+            "text": _EVALUATION_PREFIX_BY_PURPOSE[purpose],
+            "cache_control": _CACHE_CONTROL,
+        },
+        {
+            "type": "text",
+            "text": build_dynamic_suffix(
+                email_subject=email_subject,
+                email_body=email_body,
+                purpose=purpose,
+                tone=tone,
+                length=length,
+                original_request=original_request,
+            ),
+        },
+    ]
+
+
+def build_evaluation_prompt(
+    email_subject: str,
+    email_body: str,
+    purpose: PurposeEnum,
+    tone: ToneEnum,
+    length: LengthEnum,
+    original_request: str,
+) -> str:
+    """Construct the prompt for LLM-based email evaluation as a single string."""
+    return "".join(
+        part["text"]
+        for part in build_evaluation_content(
+            email_subject=email_subject,
+            email_body=email_body,
+            purpose=purpose,
+            tone=tone,
+            length=length,
+            original_request=original_request,
+        )
+    )
+
+
+def _build_metric_rubric(metric_name: str) -> str:
+    """Render the static metric description, scoring guide and output format for one metric."""
+    criteria = EVALUATION_CRITERIA[metric_name]
+
+    scoring_guide = "\n".join(
+        f"- {score}: {text}" for score, text in criteria["scoring_guide"].items()
+    )
+    check_points = criteria.get("check_points") or criteria.get("required_elements") or []
+    check_section = ""
+    if check_points:
+        check_section = "Check for:\n" + "\n".join(f"- {point}" for point in check_points) + "\n\n"
+
+    return f"""=== METRIC: {criteria["name"].upper()} ===
+{criteria["description"]}
+
+{check_section}Scoring guide:
+{scoring_guide}
+
+=== OUTPUT FORMAT ===
+Respond with only a JSON object in exactly this format:
+{{"score": X, "justification": "...", "suggestions": "..."}}
+
+IMPORTANT:
+- The score must be an integer from 1-10
+- Justification: at most 12 words explaining the score
+- Suggestions: at most 15 words, specific and actionable (null if score is 8+)
+- Be strict but fair in your evaluation
+
+"""
+
+
+_METRIC_PROMPT_HEADER = (
+    "You are an expert email quality evaluator for financial advisor communications.\n"
+    "Score ONE metric for the generated email at the end of this message.\n\n"
+)
+
+# Header, metric rubric and reference example have no per-request fields, so the
+# cacheable prefix for every LLM-scored (metric, purpose) pair is rendered once at import
+_METRIC_PREFIX_BY_NAME_AND_PURPOSE: dict[tuple[str, PurposeEnum], str] = {
+    (name, purpose): _METRIC_PROMPT_HEADER + _build_metric_rubric(name) + reference
+    for name in LLM_METRIC_NAMES
+    for purpose, reference in _REFERENCE_BLOCK_BY_PURPOSE.items()
+}
+
+
+def build_metric_content(
+    metric_name: str,
+    email_subject: str,
+    email_body: str,
+    purpose: PurposeEnum,
+    tone: ToneEnum,
+    length: LengthEnum,
+    original_request: str,
+) -> list[dict]:
+    """
+    Construct a prompt that scores a single metric from EVALUATION_CRITERIA, as content parts.
+    The metric rubric and reference example form a cacheable prefix; only the last part varies.
+    """
+    return [
+        {
+            "type": "text",
+            "text": _METRIC_PREFIX_BY_NAME_AND_PURPOSE[metric_name, purpose],
+            "cache_control": _CACHE_CONTROL,
+        },
+        {
+            "type": "text",
+            "text": build_dynamic_suffix(
+                email_subject=email_subject,
+                email_body=email_body,
+                purpose=purpose,
+                tone=tone,
+                length=length,
+                original_request=original_request,
+            ),
+        },
+    ]
+
+
+def build_metric_prompt(
+    metric_name: str,
+    email_subject: str,
+    email_body: str,
+    purpose: PurposeEnum,
+    tone: ToneEnum,
+    length: LengthEnum,
+    original_request: str,
+) -> str:
+    """Construct a prompt that scores a single metric from EVALUATION_CRITERIA as a single string."""
+    return "".join(
+        part["text"]
+        for part in build_metric_content(
+            metric_name=metric_name,
+            email_subject=email_subject,
+            email_body=email_body,
+            purpose=purpose,
+            tone=tone,
+            length=length,
+            original_request=original_request,
+        )
+    )
+
+
+# Fallback scores used when the evaluation response can't be parsed. Risk balance and
+# disclaimer accuracy default to 8, their "not applicable" score.
+_DEFAULT_EVAL_DATA = {
+    name: {"score": 5, "justification": "Could not parse evaluation", "suggestions": None}
+    for name in METRIC_NAMES
+}
+_DEFAULT_EVAL_DATA["compliance"] = {**_DEFAULT_EVAL_DATA["compliance"], "suggestions": "Re-run evaluation"}
+for _name in ("risk_balance", "disclaimer_accuracy"):
+    _DEFAULT_EVAL_DATA[_name] = {**_DEFAULT_EVAL_DATA[_name], "score": 8}
+
+# Shared placeholder for a metric missing from the evaluator's output
+_FALLBACK_METRIC_SCORE = MetricScore.model_construct(
+    score=5,
+    justification="Metric not evaluated",
+    suggestions="Re-run evaluation",
+)
+
+
+def find_compliance_triggers(text: str) -> list[str]:
+    """Return the labels of prohibited phrases used affirmatively in text."""
+    text_lower = text.lower()
+    hits = []
+    for label, pattern in COMPLIANCE_TRIGGER_PATTERNS:
+        for match in pattern.finditer(text_lower):
+            if not _is_disclaimer_context(text_lower, match.start(), label):
+                hits.append(label)
+                break
+    return hits
+
+
+def _precheck_compliance_score(triggers: list[str]) -> tuple[MetricScore, str]:
+    """Compliance score and improvement note for an email that used prohibited language."""
+    phrases = ", ".join(f'"{phrase}"' for phrase in triggers)
+    suggestion = f"Remove prohibited language ({phrases}) and rephrase without guarantees or urgency."
+    score = MetricScore.model_construct(
+        score=2,
+        justification=f"Contains prohibited language: {phrases}.",
+        suggestions=suggestion,
+    )
+    return score, suggestion
+
+
+def _is_disclaimer_context(text_lower: str, start: int, label: str) -> bool:
+    """Whether the clause leading up to a trigger negates it or attributes it to a guarantor."""
+    clause_start = max(0, start - _CLAUSE_LOOKBACK)
+    for boundary in _CLAUSE_BOUNDARY_RE.finditer(text_lower, clause_start, start):
+        clause_start = boundary.end()
+    clause = text_lower[clause_start:start]
+
+    if _NEGATION_RE.search(clause):
+        return True
+    return label == "guaranteed" and _THIRD_PARTY_GUARANTOR_RE.search(clause) is not None
+
+
+def _extract_json(response: str) -> dict:
+    """Extract the JSON object from an LLM response (fenced or raw)."""
+    # Look for a ```json fenced block
+    start = response.find("```json")
+    end = response.find("```", start + 7) if start >= 0 else -1
+    if end >= 0:
+        json_str = response[start + 7:end].strip()
+    else:
+        # Fall back to the outermost braces
+        start = response.find("{")
+        end = response.rfind("}")
+        if start < 0 or end < start:
+            raise ValueError("No JSON found in response")
+        json_str = response[start:end + 1]
+
+    return orjson.loads(json_str)
 
 
 def parse_evaluation_response(response: str) -> dict:
     """Parse the LLM's evaluation response into structured data."""
     # Try to extract JSON from the response
     try:
-        # Look for JSON block
-        json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(1)
-        else:
-            # Try to find raw JSON
-            json_match = re.search(r'\{[\s\S]*\}', response)
-            if json_match:
-                json_str = json_match.group(0)
-            else:
-                raise ValueError("No JSON found in response")
+        return _extract_json(response)
 
-        return json.loads(json_str)
-
-    except (json.JSONDecodeError, ValueError) as e:
+    except ValueError as e:  # orjson.JSONDecodeError is a ValueError
         logger.error("Failed to parse evaluation response", error=str(e))
-        # Return default scores if parsing fails
+        # Return default scores if parsing fails (fresh lists so callers can't mutate the template)
         return {
-            "compliance": {"score": 5, "justification": "Could not parse evaluation", "suggestions": "Re-run evaluation"},
-            "tone_consistency": {"score": 5, "justification": "Could not parse evaluation", "suggestions": None},
-            "length_accuracy": {"score": 5, "justification": "Could not parse evaluation", "suggestions": None},
-            "structure_completeness": {"score": 5, "justification": "Could not parse evaluation", "suggestions": None},
-            "purpose_alignment": {"score": 5, "justification": "Could not parse evaluation", "suggestions": None},
-            "clarity": {"score": 5, "justification": "Could not parse evaluation", "suggestions": None},
-            "professionalism": {"score": 5, "justification": "Could not parse evaluation", "suggestions": None},
-            "personalization": {"score": 5, "justification": "Could not parse evaluation", "suggestions": None},
-            "risk_balance": {"score": 8, "justification": "Could not parse evaluation", "suggestions": None},
-            "disclaimer_accuracy": {"score": 8, "justification": "Could not parse evaluation", "suggestions": None},
+            **_DEFAULT_EVAL_DATA,
             "strengths": [],
-            "improvements_needed": ["Evaluation parsing failed - please re-evaluate"]
+            "improvements_needed": ["Evaluation parsing failed - please re-evaluate"],
         }
 
 
+class _JsonObjectScanner:
+    """Tracks brace depth over streamed text to detect when the first JSON object is complete."""
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> bool:
+        """Consume a chunk of text; return True once the outermost object has closed."""
+        for char in text:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                # Strings only matter inside the object; quotes in surrounding prose are ignored
+                self.in_string = self.started
+            elif char == "{":
+                self.depth += 1
+                self.started = True
+            elif char == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
+
 class EmailEvaluationService:
     """Service for evaluating generated emails using LLM-based scoring."""
 
@@ -215,6 +555,8 @@ class EmailEvaluationService:
         self.api_key = settings.openrouter_api_key
         self.base_url = settings.openrouter_base_url
         self.model = settings.openrouter_model
+        self.eval_mode = settings.eval_mode
+        self.compliance_precheck = settings.eval_compliance_precheck
 
         if not self.api_key:
             raise ValueError("OpenRouter API key not configured")
@@ -226,6 +568,14 @@ class EmailEvaluationService:
             "X-Title": "FMG Muse Email Evaluator",
         }
 
+        # Results keyed by a hash of the evaluation inputs; identical concurrent
+        # calls share one in-flight task instead of each hitting the LLM
+        self._result_cache = ResponseCache(
+            maxsize=EVALUATION_CACHE_SIZE,
+            ttl_seconds=settings.response_cache_ttl_seconds,
+        )
+        self._inflight: dict[str, asyncio.Task] = {}
+
     async def evaluate_email(
         self,
         email_subject: str,
@@ -237,11 +587,84 @@ class EmailEvaluationService:
         model: Optional[str] = None,
     ) -> EvaluationMetrics:
         """Evaluate a generated email against quality metrics."""
-        import httpx
+        return await self._evaluate_shared(
+            eval_mode=self.eval_mode,
+            email_subject=email_subject,
+            email_body=email_body,
+            purpose=purpose,
+            tone=tone,
+            length=length,
+            original_request=original_request,
+        )
 
+    async def _evaluate_shared(
+        self,
+        eval_mode: str,
+        email_subject: str,
+        email_body: str,
+        purpose: PurposeEnum,
+        tone: ToneEnum,
+        length: LengthEnum,
+        original_request: str,
+    ) -> EvaluationMetrics:
+        """Serve an evaluation from the cache or an identical in-flight call, else start one."""
         # Always use fast evaluation model (ignore user's model for eval)
         effective_model = EVALUATION_MODEL
 
+        cache_key = make_cache_key(
+            effective_model, eval_mode, purpose.value, tone.value, length.value,
+            email_subject, email_body, original_request,
+        )
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Email evaluation cache hit", purpose=purpose.value)
+            return cached
+
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._evaluate_uncached(
+                email_subject=email_subject,
+                email_body=email_body,
+                purpose=purpose,
+                tone=tone,
+                length=length,
+                original_request=original_request,
+                model=effective_model,
+                eval_mode=eval_mode,
+            ))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda done: self._finish_evaluation(cache_key, done))
+
+        # Shielded so one cancelled caller doesn't cancel the evaluation for the others
+        return await asyncio.shield(task)
+
+    def _finish_evaluation(self, cache_key: str, task: asyncio.Task) -> None:
+        """Drop a finished evaluation from the in-flight map and cache it if it succeeded."""
+        self._inflight.pop(cache_key, None)
+        if not task.cancelled() and task.exception() is None:
+            self._result_cache.set(cache_key, task.result())
+
+    async def _evaluate_uncached(
+        self,
+        email_subject: str,
+        email_body: str,
+        purpose: PurposeEnum,
+        tone: ToneEnum,
+        length: LengthEnum,
+        original_request: str,
+        model: str,
+        eval_mode: str,
+    ) -> EvaluationMetrics:
+        """Run the LLM evaluation for one email (no caching)."""
+        effective_model = model
+
+        precheck = None
+        if self.compliance_precheck:
+            triggers = find_compliance_triggers(f"{email_subject}\n{email_body}")
+            if triggers:
+                logger.info("Compliance pre-check found prohibited language", triggers=triggers)
+                precheck = _precheck_compliance_score(triggers)
+
         logger.info(
             "Starting email evaluation",
             subject_preview=email_subject[:50] if email_subject else "",
@@ -249,71 +672,65 @@ class EmailEvaluationService:
             tone=tone.value,
             length=length.value,
             model=effective_model,
+            eval_mode=eval_mode,
         )
 
-        # Build evaluation prompt
-        prompt = build_evaluation_prompt(
-            email_subject=email_subject,
-            email_body=email_body,
-            purpose=purpose,
-            tone=tone,
-            length=length,
-            original_request=original_request,
-        )
-
-        # Call LLM for evaluation
-        payload = {
-            "model": effective_model,
-            "messages": [
-                {"role": "system", "content": "You are an expert email quality evaluator. Always respond with valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.2,  # Low temperature for consistent, reliable scoring
-            "max_tokens": 2000,
-        }
-
-        # Minimize reasoning for evaluation
-        if "gpt-5" in effective_model.lower():
-            payload["reasoning"] = {"effort": "minimal"}
-
-        try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=self.headers,
-                    json=payload,
+        if eval_mode == "parallel":
+            eval_data = await self._evaluate_metrics_parallel(
+                email_subject=email_subject,
+                email_body=email_body,
+                purpose=purpose,
+                tone=tone,
+                length=length,
+                original_request=original_request,
+                model=effective_model,
+                # A pre-check hit already decides compliance, so its LLM call is skipped
+                metric_names=_PRECHECKED_METRIC_NAMES if precheck else LLM_METRIC_NAMES,
+            )
+        else:
+            # Build evaluation prompt (static rubric first so the provider can cache it)
+            prompt = build_evaluation_content(
+                email_subject=email_subject,
+                email_body=email_body,
+                purpose=purpose,
+                tone=tone,
+                length=length,
+                original_request=original_request,
+            )
+
+            try:
+                content = await self._request_evaluation(
+                    prompt,
+                    effective_model,
+                    response_format=EVALUATION_RESPONSE_FORMAT,
                 )
+            except Exception as e:
+                logger.error("Evaluation failed", error=str(e))
+                raise
 
-                if response.status_code != 200:
-                    logger.error("Evaluation API error", status_code=response.status_code)
-                    raise Exception(f"Evaluation API error: {response.status_code}")
+            # Parse the evaluation response
+            eval_data = parse_evaluation_response(content)
 
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
-
-        except Exception as e:
-            logger.error("Evaluation failed", error=str(e))
-            raise
-
-        # Parse the evaluation response
-        eval_data = parse_evaluation_response(content)
-
-        # Build MetricScore objects
+        # Build MetricScore objects - values are sanitized here, so skip pydantic re-validation
         metrics = {}
-        for metric_name in EVALUATION_CRITERIA.keys():
-            if metric_name in eval_data:
+        for metric_name in METRIC_NAMES:
+            if metric_name == "length_accuracy":
+                metrics[metric_name] = score_length_accuracy(email_body, length.value)
+            elif metric_name in eval_data:
                 metric_data = eval_data[metric_name]
-                metrics[metric_name] = MetricScore(
-                    score=min(10, max(1, metric_data.get("score", 5))),
-                    justification=metric_data.get("justification", "No justification provided"),
-                    suggestions=metric_data.get("suggestions"),
+                metrics[metric_name] = MetricScore.model_construct(
+                    score=min(10, max(1, int(metric_data.get("score", 5)))),
+                    justification=str(metric_data.get("justification") or "No justification provided"),
+                    suggestions=metric_data.get("suggestions") or None,
                 )
             else:
-                metrics[metric_name] = MetricScore(
-                    score=5,
-                    justification="Metric not evaluated",
-                    suggestions="Re-run evaluation",
-                )
+                metrics[metric_name] = _FALLBACK_METRIC_SCORE
+
+        improvements_needed = eval_data.get("improvements_needed", [])
+        if precheck:
+            # Prohibited language decides compliance; every other metric keeps its evaluated score
+            metrics["compliance"], suggestion = precheck
+            improvements_needed = [suggestion, *improvements_needed]
 
         # Calculate overall score
         overall_score = calculate_overall_score(metrics)
@@ -333,7 +750,7 @@ class EmailEvaluationService:
             rewrite_recommended=rewrite_recommended,
         )
 
-        return EvaluationMetrics(
+        return EvaluationMetrics.model_construct(
             compliance=metrics["compliance"],
             tone_consistency=metrics["tone_consistency"],
             length_accuracy=metrics["length_accuracy"],
@@ -347,10 +764,203 @@ class EmailEvaluationService:
             overall_score=overall_score,
             pass_threshold=pass_threshold,
             strengths=eval_data.get("strengths", []),
-            improvements_needed=eval_data.get("improvements_needed", []),
+            improvements_needed=improvements_needed,
             rewrite_recommended=rewrite_recommended,
         )
 
+    async def _request_evaluation(
+        self,
+        prompt: Union[str, list[dict]],
+        model: str,
+        max_tokens: int = BATCHED_MAX_TOKENS,
+        response_format: Optional[dict] = None,
+    ) -> str:
+        """
+        Send an evaluation prompt to OpenRouter and return the raw response content.
+        prompt may be a plain string or a list of content parts (see build_evaluation_content).
+        The response is streamed and the stream is closed as soon as the JSON object is complete.
+        """
+        payload = {
+            "model": model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": [
+                        {"type": "text", "text": EVALUATION_SYSTEM_PROMPT, "cache_control": _CACHE_CONTROL}
+                    ],
+                },
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.2,  # Low temperature for consistent, reliable scoring
+            "max_tokens": max_tokens,
+            "stream": True,
+            "provider": EVALUATION_PROVIDER_PREFERENCES,
+        }
+
+        if response_format:
+            payload["response_format"] = response_format
+
+        # Minimize reasoning for evaluation
+        if "gpt-5" in model.lower():
+            payload["reasoning"] = {"effort": "minimal"}
+
+        scanner = _JsonObjectScanner()
+        parts = []
+
+        async with get_http_client().stream(
+            "POST",
+            f"{self.base_url}/chat/completions",
+            headers=self.headers,
+            content=orjson.dumps(payload),
+            timeout=LLM_TIMEOUT,
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                logger.error("Evaluation API error", status_code=response.status_code)
+                raise Exception(f"Evaluation API error: {response.status_code}")
+
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:]  # Remove "data: " prefix
+                if data == "[DONE]":
+                    break
+                try:
+                    chunk = orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    continue
+
+                choices = chunk.get("choices")
+                delta = choices[0].get("delta", {}).get("content") if choices else None
+                if not delta:
+                    continue
+
+                parts.append(delta)
+                # Nothing after the closing brace is used, so stop generation there
+                if scanner.feed(delta):
+                    break
+
+        return "".join(parts)
+
+    async def _evaluate_metrics_parallel(
+        self,
+        email_subject: str,
+        email_body: str,
+        purpose: PurposeEnum,
+        tone: ToneEnum,
+        length: LengthEnum,
+        original_request: str,
+        model: str,
+        metric_names: tuple[str, ...] = LLM_METRIC_NAMES,
+    ) -> dict:
+        """
+        Score each of metric_names with its own scoped prompt, running the calls concurrently.
+        Returns data in the same shape as parse_evaluation_response().
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_METRIC_CALLS)
+
+        async def score_metric(metric_name: str) -> dict:
+            prompt = build_metric_content(
+                metric_name=metric_name,
+                email_subject=email_subject,
+                email_body=email_body,
+                purpose=purpose,
+                tone=tone,
+                length=length,
+                original_request=original_request,
+            )
+            async with semaphore:
+                content = await self._request_evaluation(
+                    prompt,
+                    model,
+                    max_tokens=METRIC_MAX_TOKENS,
+                    response_format=METRIC_RESPONSE_FORMAT,
+                )
+            return _extract_json(content)
+
+        results = await asyncio.gather(
+            *(score_metric(name) for name in metric_names),
+            return_exceptions=True,
+        )
+
+        eval_data = {}
+        failures = []
+        for metric_name, result in zip(metric_names, results):
+            if isinstance(result, BaseException):
+                failures.append(metric_name)
+                logger.warning("Metric evaluation failed", metric=metric_name, error=str(result))
+            else:
+                eval_data[metric_name] = result
+
+        # Every metric failing means the evaluator itself is unavailable
+        if not eval_data:
+            raise Exception(f"Evaluation failed for all metrics: {', '.join(failures)}")
+
+        # Derive the summary lists that the single-prompt evaluation asks the LLM for
+        scored = [
+            (name, data) for name, data in eval_data.items()
+            if isinstance(data.get("score"), int)
+        ]
+        strong = sorted(
+            (item for item in scored if item[1]["score"] >= 8),
+            key=lambda item: item[1]["score"],
+            reverse=True,
+        )
+        weak = sorted(
+            (item for item in scored if item[1]["score"] < 8 and item[1].get("suggestions")),
+            key=lambda item: METRIC_WEIGHT_BY_NAME[item[0]] * (10 - item[1]["score"]),
+            reverse=True,
+        )
+        eval_data["strengths"] = [data.get("justification", "") for _, data in strong[:4]]
+        eval_data["improvements_needed"] = [data["suggestions"] for _, data in weak[:3]]
+
+        return eval_data
+
+    async def evaluate_email_batch(
+        self,
+        items: list[EmailEvaluationRequest],
+    ) -> list[Optional[EvaluationMetrics]]:
+        """
+        Evaluate many emails for offline scoring (regression suites, quality runs).
+
+        Every item is scored with the single-prompt evaluation whatever eval_mode is,
+        so the batch never has more than MAX_CONCURRENT_BATCH_EVALUATIONS LLM calls in flight.
+        Results are returned in input order; an email whose evaluation failed maps to None.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCH_EVALUATIONS)
+
+        async def evaluate_item(item: EmailEvaluationRequest) -> EvaluationMetrics:
+            async with semaphore:
+                return await self._evaluate_shared(
+                    eval_mode="batched",
+                    email_subject=item.subject,
+                    email_body=item.body,
+                    purpose=item.purpose,
+                    tone=item.tone,
+                    length=item.length,
+                    original_request=item.original_request,
+                )
+
+        results = await asyncio.gather(
+            *(evaluate_item(item) for item in items),
+            return_exceptions=True,
+        )
+
+        metrics_list = []
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logger.warning("Batch evaluation item failed", index=index, error=str(result))
+                metrics_list.append(None)
+            else:
+                metrics_list.append(result)
+
+        logger.info(
+            "Batch evaluation complete",
+            total=len(items),
+            failed=sum(1 for metrics in metrics_list if metrics is None),
+        )
+        return metrics_list
+
     async def evaluate_and_suggest_improvements(
         self,
         email_subject: str,
@@ -376,30 +986,32 @@ class EmailEvaluationService:
         )
 
         # Build prioritized improvement list based on weights and scores
-        priority_improvements = []
+        candidates = []
+        quick_wins = []
+        metric_scores = vars(metrics)
 
-        for metric_name, criteria in EVALUATION_CRITERIA.items():
-            metric_score = getattr(metrics, metric_name)
+        for metric_name, weight in METRIC_WEIGHT_BY_NAME.items():
+            metric_score = metric_scores[metric_name]
             if metric_score.score < 8 and metric_score.suggestions:
-                priority_improvements.append({
+                improvement = {
                     "metric": metric_name,
                     "current_score": metric_score.score,
-                    "weight": criteria["weight"],
-                    "priority": criteria["weight"] * (10 - metric_score.score),
+                    "weight": weight,
+                    "priority": weight * (10 - metric_score.score),
                     "suggestion": metric_score.suggestions,
                     "justification": metric_score.justification,
-                })
+                }
+                candidates.append(improvement)
+                # Easy improvements with smaller impact
+                if metric_score.score >= 6 and weight <= 0.10:
+                    quick_wins.append(improvement)
 
-        # Sort by priority (highest first)
-        priority_improvements.sort(key=lambda x: x["priority"], reverse=True)
+        priority_key = itemgetter("priority")
 
         return {
             "metrics": metrics,
-            "priority_improvements": priority_improvements[:5],  # Top 5 improvements
-            "quick_wins": [
-                imp for imp in priority_improvements
-                if imp["current_score"] >= 6 and imp["weight"] <= 0.10
-            ][:3],  # Easy improvements with smaller impact
+            "priority_improvements": heapq.nlargest(5, candidates, key=priority_key),  # Top 5 improvements
+            "quick_wins": heapq.nlargest(3, quick_wins, key=priority_key),
         }
 
 
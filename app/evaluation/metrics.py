@@ -3,6 +3,9 @@ Evaluation metrics and scoring rubric for email quality assessment.
 Each metric is scored 1-10 by the LLM evaluator.
 """
 
+import re
+
+import orjson
 from pydantic import BaseModel, Field
 from typing import Optional
 from enum import Enum
@@ -260,14 +263,21 @@ EVALUATION_CRITERIA = {
 }
 
 
+# Metric order and weights, frozen once so scoring loops don't re-walk EVALUATION_CRITERIA
+METRIC_NAMES: tuple[str, ...] = tuple(EVALUATION_CRITERIA)
+METRIC_WEIGHTS: tuple[float, ...] = tuple(c["weight"] for c in EVALUATION_CRITERIA.values())
+METRIC_WEIGHT_BY_NAME: dict[str, float] = dict(zip(METRIC_NAMES, METRIC_WEIGHTS))
+TOTAL_METRIC_WEIGHT: float = sum(METRIC_WEIGHTS)
+
+
 def calculate_overall_score(metrics: dict[str, MetricScore]) -> float:
     """Calculate weighted average score from individual metrics."""
     total_weight = 0
     weighted_sum = 0
 
-    for metric_name, score in metrics.items():
-        if metric_name in EVALUATION_CRITERIA:
-            weight = EVALUATION_CRITERIA[metric_name]["weight"]
+    for name, weight in zip(METRIC_NAMES, METRIC_WEIGHTS):
+        score = metrics.get(name)
+        if score is not None:
             weighted_sum += score.score * weight
             total_weight += weight
 
@@ -277,11 +287,72 @@ def calculate_overall_score(metrics: dict[str, MetricScore]) -> float:
     return round(weighted_sum / total_weight, 2)
 
 
+# Body word-count ranges parsed from the length targets ("50-100 words, ...") so the
+# local scorer and the documented targets cannot drift apart
+_WORD_RANGE_RE = re.compile(r"(\d+)-(\d+) words")
+
+LENGTH_WORD_RANGES: dict[str, tuple[int, int]] = {
+    length: tuple(int(bound) for bound in _WORD_RANGE_RE.match(target).groups())
+    for length, target in EVALUATION_CRITERIA["length_accuracy"]["length_targets"].items()
+}
+
+
+def score_length_accuracy(email_body: str, length: str) -> MetricScore:
+    """
+    Score length_accuracy locally by counting body words against the target range.
+    Follows the metric's scoring guide: deviation is measured from the nearest range bound.
+    """
+    low, high = LENGTH_WORD_RANGES[length]
+    word_count = len(email_body.split())
+
+    if low <= word_count <= high:
+        deviation = 0.0
+    elif word_count < low:
+        deviation = (low - word_count) / low
+    else:
+        deviation = (word_count - high) / high
+
+    if deviation == 0:
+        score = 10
+    elif deviation <= 0.10:
+        score = 8
+    elif deviation <= 0.25:
+        score = 6
+    elif deviation <= 0.50:
+        score = 4
+    elif deviation < 1.0:
+        score = 2
+    else:
+        score = 1
+
+    suggestions = None
+    if score < 8:
+        action = "Expand" if word_count < low else "Trim"
+        suggestions = f"{action} the body to {low}-{high} words."
+
+    return MetricScore.model_construct(
+        score=score,
+        justification=f"Body is {word_count} words; the {length} target is {low}-{high} words.",
+        suggestions=suggestions,
+    )
+
+
 def get_metric_names() -> list[str]:
     """Return list of all metric names."""
-    return list(EVALUATION_CRITERIA.keys())
+    return list(METRIC_NAMES)
 
 
 def get_metric_weights() -> dict[str, float]:
     """Return mapping of metric names to their weights."""
-    return {name: criteria["weight"] for name, criteria in EVALUATION_CRITERIA.items()}
+    return dict(METRIC_WEIGHT_BY_NAME)
+
+
+# Static /evaluation/metrics response, serialized once at import
+EVALUATION_METRICS_PAYLOAD = orjson.dumps({
+    "metrics": {
+        name: {key: criteria[key] for key in ("name", "weight", "description", "scoring_guide")}
+        for name, criteria in EVALUATION_CRITERIA.items()
+    },
+    "pass_threshold": 7.0,
+    "total_weight": TOTAL_METRIC_WEIGHT,
+}, option=orjson.OPT_NON_STR_KEYS)
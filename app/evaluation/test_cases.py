@@ -10,7 +10,11 @@ Structure:
 - Tags and metadata enable retrieval of relevant examples during generation
 """
 
-from typing import Optional
+import heapq
+import orjson
+from functools import lru_cache
+from operator import itemgetter
+from typing import NamedTuple, Optional
 from app.models.email import PurposeEnum, ToneEnum, LengthEnum
 
 
@@ -1110,35 +1114,32 @@ With deepest sympathy,
 
 def get_conversation_by_id(conversation_id: str) -> dict | None:
     """Retrieve a specific conversation by ID."""
-    for conv in IDEAL_CONVERSATIONS:
-        if conv["id"] == conversation_id:
-            return conv
-    return None
+    return _CONVERSATION_BY_ID.get(conversation_id)
 
 
 def get_conversations_by_purpose(purpose: PurposeEnum) -> list[dict]:
     """Retrieve all conversations for a specific purpose."""
-    return [conv for conv in IDEAL_CONVERSATIONS if conv["purpose"] == purpose]
+    return _CONVERSATIONS_BY_PURPOSE.get(purpose, [])
 
 
 def get_conversations_by_tone(tone: ToneEnum) -> list[dict]:
     """Retrieve all conversations for a specific tone."""
-    return [conv for conv in IDEAL_CONVERSATIONS if conv["tone"] == tone]
+    return _CONVERSATIONS_BY_TONE.get(tone, [])
 
 
 def get_conversations_by_length(length: LengthEnum) -> list[dict]:
     """Retrieve all conversations for a specific length."""
-    return [conv for conv in IDEAL_CONVERSATIONS if conv["length"] == length]
+    return _CONVERSATIONS_BY_LENGTH.get(length, [])
 
 
 def get_multi_turn_conversations() -> list[dict]:
     """Retrieve all conversations that have multiple turns (refinements)."""
-    return [conv for conv in IDEAL_CONVERSATIONS if len(conv["conversation"]) > 2]
+    return _MULTI_TURN_CONVERSATIONS
 
 
 def get_single_turn_conversations() -> list[dict]:
     """Retrieve all conversations that are single turn (request -> email)."""
-    return [conv for conv in IDEAL_CONVERSATIONS if len(conv["conversation"]) == 2]
+    return _SINGLE_TURN_CONVERSATIONS
 
 
 def get_all_conversations() -> list[dict]:
@@ -1157,23 +1158,24 @@ def search_conversations_by_tags(search_tags: list[str], match_all: bool = False
     Returns:
         List of matching conversations, sorted by number of matching tags (descending)
     """
-    results = []
     search_tags_lower = [tag.lower() for tag in search_tags]
+    if not search_tags_lower:
+        return list(IDEAL_CONVERSATIONS) if match_all else []
 
-    for conv in IDEAL_CONVERSATIONS:
-        conv_tags_lower = [tag.lower() for tag in conv.get("tags", [])]
-        matching_tags = [tag for tag in search_tags_lower if tag in conv_tags_lower]
+    # Count matching tags per conversation from the posting lists
+    match_counts: dict[int, int] = {}
+    for tag in search_tags_lower:
+        for position in _TAG_INDEX.get(tag, ()):
+            match_counts[position] = match_counts.get(position, 0) + 1
 
-        if match_all:
-            if len(matching_tags) == len(search_tags_lower):
-                results.append((conv, len(matching_tags)))
-        else:
-            if len(matching_tags) > 0:
-                results.append((conv, len(matching_tags)))
+    if match_all:
+        match_counts = {
+            position: count for position, count in match_counts.items() if count == len(search_tags_lower)
+        }
 
-    # Sort by number of matching tags (descending)
-    results.sort(key=lambda x: x[1], reverse=True)
-    return [conv for conv, _ in results]
+    # Sort by number of matching tags (descending), ties in corpus order
+    ranked = sorted(match_counts, key=lambda position: (-match_counts[position], position))
+    return [IDEAL_CONVERSATIONS[position] for position in ranked]
 
 
 def find_similar_conversations(
@@ -1200,53 +1202,93 @@ def find_similar_conversations(
     Returns:
         List of most relevant conversations, ranked by relevance
     """
+    # Fresh list per call so callers can't mutate the cached ranking
+    return list(_rank_similar_conversations(purpose, tone, length, user_input, max_results))
+
+
+@lru_cache(maxsize=512)
+def _rank_similar_conversations(
+    purpose: PurposeEnum,
+    tone: ToneEnum,
+    length: LengthEnum,
+    user_input: str,
+    max_results: int,
+) -> tuple[dict, ...]:
+    """Score every conversation against the query; memoized since the data is static."""
     scored_conversations = []
 
     # Extract keywords from user input (simple approach)
     user_words = set(user_input.lower().split())
+    tag_hits = _tag_keyword_hits(user_words)
 
-    for conv in IDEAL_CONVERSATIONS:
+    for position, (conv, features) in enumerate(zip(IDEAL_CONVERSATIONS, _RETRIEVAL_FEATURES)):
         score = 0
 
         # Exact purpose match is most important
-        if conv["purpose"] == purpose:
+        if features.purpose == purpose:
             score += 10
 
         # Tone match
-        if conv["tone"] == tone:
+        if features.tone == tone:
             score += 5
 
         # Length match
-        if conv["length"] == length:
+        if features.length == length:
             score += 3
 
         # Tag matching (keyword overlap)
-        conv_tags_lower = [tag.lower() for tag in conv.get("tags", [])]
-        for word in user_words:
-            if len(word) > 3:  # Skip short words
-                for tag in conv_tags_lower:
-                    if word in tag or tag in word:
-                        score += 2
+        score += tag_hits.get(position, 0) * 2
 
         # Scenario text matching
-        scenario_words = set(conv.get("scenario", "").lower().split())
-        overlap = user_words.intersection(scenario_words)
+        overlap = user_words.intersection(features.scenario_words)
         score += len(overlap) * 1.5
 
         # Check first user message for similarity
-        if conv["conversation"]:
-            first_msg = conv["conversation"][0].get("content", "").lower()
-            first_msg_words = set(first_msg.split())
-            msg_overlap = user_words.intersection(first_msg_words)
-            score += len(msg_overlap) * 2
+        msg_overlap = user_words.intersection(features.first_msg_words)
+        score += len(msg_overlap) * 2
 
         if score > 0:
             scored_conversations.append((conv, score))
 
-    # Sort by score descending
-    scored_conversations.sort(key=lambda x: x[1], reverse=True)
+    # Only the top few are returned, so select them without sorting everything
+    top_scored = heapq.nlargest(max_results, scored_conversations, key=itemgetter(1))
+
+    return tuple(conv for conv, _ in top_scored)
+
+
+def _tag_keyword_hits(user_words: set[str]) -> dict[int, int]:
+    """
+    Count, per conversation position, the (word, tag) pairs where one contains the other.
+
+    Words of 3 characters or fewer are skipped. Both directions are answered from
+    the substring indexes instead of testing every word against every tag.
+    """
+    hits: dict[int, int] = {}
+    for word in user_words:
+        if len(word) <= 3:  # Skip short words
+            continue
+
+        # Tags containing the word
+        slots = set(_TAG_SUBSTRING_INDEX.get(word, ()))
+
+        # Tags contained in the word: only substrings of an existing tag length can hit
+        for size in _TAG_LENGTHS:
+            for start in range(len(word) - size + 1):
+                slots.update(_TAG_SLOT_INDEX.get(word[start:start + size], ()))
+
+        for position, _ in slots:
+            hits[position] = hits.get(position, 0) + 1
 
-    return [conv for conv, _ in scored_conversations[:max_results]]
+    return hits
+
+
+_REFINEMENT_KEYWORDS: dict[str, list[str]] = {
+    "shorter": ["shorter", "concise", "brief"],
+    "longer": ["more detail", "longer", "expand"],
+    "tone_change": ["tone", "formal", "friendly", "casual", "warm", "stiff"],
+    "more_detail": ["more detail", "add more", "expand", "elaborate"],
+    "compliance_fix": ["compliance", "risk", "guarantee", "promise"],
+}
 
 
 def get_conversation_for_refinement(
@@ -1264,31 +1306,29 @@ def get_conversation_for_refinement(
     Returns:
         A relevant multi-turn conversation, or None if not found
     """
-    refinement_keywords = {
-        "shorter": ["shorter", "concise", "brief"],
-        "longer": ["more detail", "longer", "expand"],
-        "tone_change": ["tone", "formal", "friendly", "casual", "warm", "stiff"],
-        "more_detail": ["more detail", "add more", "expand", "elaborate"],
-        "compliance_fix": ["compliance", "risk", "guarantee", "promise"],
-    }
+    # First multi-turn conversation whose refinement requests mention the type's keywords
+    conv = _REFINEMENT_EXAMPLE_BY_TYPE.get(refinement_type)
+    if conv is not None:
+        return conv
 
-    keywords = refinement_keywords.get(refinement_type, [])
-    multi_turn = get_multi_turn_conversations()
+    # Fallback: return any multi-turn conversation with matching purpose
+    conv = _MULTI_TURN_BY_PURPOSE.get(purpose)
+    if conv is not None:
+        return conv
+
+    return _MULTI_TURN_CONVERSATIONS[0] if _MULTI_TURN_CONVERSATIONS else None
 
-    for conv in multi_turn:
+
+def _find_refinement_example(keywords: list[str]) -> dict | None:
+    """First multi-turn conversation with a refinement request containing any keyword."""
+    for conv in _MULTI_TURN_CONVERSATIONS:
         # Check if any refinement request contains the keywords
         for msg in conv["conversation"]:
             if msg.get("message_type") == "refinement_request":
                 content_lower = msg.get("content", "").lower()
                 if any(kw in content_lower for kw in keywords):
                     return conv
-
-    # Fallback: return any multi-turn conversation with matching purpose
-    for conv in multi_turn:
-        if conv["purpose"] == purpose:
-            return conv
-
-    return multi_turn[0] if multi_turn else None
+    return None
 
 
 def extract_email_from_conversation(conversation: dict, get_final: bool = True) -> dict | None:
@@ -1302,18 +1342,27 @@ def extract_email_from_conversation(conversation: dict, get_final: bool = True)
     Returns:
         Dict with 'subject' and 'body' keys, or None if no email found
     """
-    emails = []
-    for msg in conversation.get("conversation", []):
-        if msg.get("email_subject") and msg.get("email_body"):
-            emails.append({
-                "subject": msg["email_subject"],
-                "body": msg["email_body"],
-            })
+    # Ideal conversations are static, so their final email is precomputed
+    conversation_id = conversation.get("id")
+    if get_final and _CONVERSATION_BY_ID.get(conversation_id) is conversation:
+        return _FINAL_EMAIL_BY_ID[conversation_id]
 
-    if not emails:
-        return None
+    return _scan_emails(conversation, get_final)
 
-    return emails[-1] if get_final else emails[0]
+
+def _scan_emails(conversation: dict, get_final: bool) -> dict | None:
+    """Walk a conversation's messages for its first or last email."""
+    messages = conversation.get("conversation", [])
+    # Walk from the end for the final email so only the wanted one is built
+    emails = (
+        {
+            "subject": msg["email_subject"],
+            "body": msg["email_body"],
+        }
+        for msg in (reversed(messages) if get_final else messages)
+        if msg.get("email_subject") and msg.get("email_body")
+    )
+    return next(emails, None)
 
 
 def format_conversation_for_prompt(conversation: dict, include_notes: bool = False) -> str:
@@ -1327,6 +1376,16 @@ def format_conversation_for_prompt(conversation: dict, include_notes: bool = Fal
     Returns:
         Formatted string representation of the conversation
     """
+    # Ideal conversations are static, so their rendering is precomputed
+    conversation_id = conversation.get("id")
+    if _CONVERSATION_BY_ID.get(conversation_id) is conversation:
+        return _FORMATTED_PROMPT_BY_ID[(conversation_id, bool(include_notes))]
+
+    return _render_conversation(conversation, include_notes)
+
+
+def _render_conversation(conversation: dict, include_notes: bool) -> str:
+    """Render a conversation as prompt text."""
     lines = []
     lines.append(f"=== Example: {conversation['scenario']} ===")
     lines.append(f"Purpose: {conversation['purpose'].value}")
@@ -1360,37 +1419,143 @@ def format_conversation_for_prompt(conversation: dict, include_notes: bool = Fal
 # =============================================================================
 # These functions maintain compatibility with code expecting the old structure
 
-def get_test_case_by_id(case_id: str) -> dict | None:
-    """
-    DEPRECATED: Use get_conversation_by_id instead.
-    Retrieve a specific test case by ID (backwards compatible).
-    """
-    return get_conversation_by_id(case_id)
+# DEPRECATED: use get_conversation_by_id, get_conversations_by_purpose,
+# get_conversations_by_tone and get_all_conversations instead. The old names are
+# bound directly to the new functions so calls skip a forwarding frame.
+get_test_case_by_id = get_conversation_by_id
+get_test_cases_by_purpose = get_conversations_by_purpose
+get_test_cases_by_tone = get_conversations_by_tone
+get_all_test_cases = get_all_conversations
 
+# Alias for backwards compatibility
+IDEAL_TEST_CASES = IDEAL_CONVERSATIONS
 
-def get_test_cases_by_purpose(purpose: PurposeEnum) -> list[dict]:
-    """
-    DEPRECATED: Use get_conversations_by_purpose instead.
-    Retrieve all test cases for a specific purpose (backwards compatible).
-    """
-    return get_conversations_by_purpose(purpose)
 
+# =============================================================================
+# LOOKUP INDEXES
+# =============================================================================
+# Built once at import so the retrieval helpers don't rescan IDEAL_CONVERSATIONS.
 
-def get_test_cases_by_tone(tone: ToneEnum) -> list[dict]:
-    """
-    DEPRECATED: Use get_conversations_by_tone instead.
-    Retrieve all test cases for a specific tone (backwards compatible).
-    """
-    return get_conversations_by_tone(tone)
+_CONVERSATIONS_BY_PURPOSE: dict[PurposeEnum, list[dict]] = {purpose: [] for purpose in PurposeEnum}
+_CONVERSATIONS_BY_TONE: dict[ToneEnum, list[dict]] = {tone: [] for tone in ToneEnum}
+_CONVERSATIONS_BY_LENGTH: dict[LengthEnum, list[dict]] = {length: [] for length in LengthEnum}
+for _conv in IDEAL_CONVERSATIONS:
+    _CONVERSATIONS_BY_PURPOSE[_conv["purpose"]].append(_conv)
+    _CONVERSATIONS_BY_TONE[_conv["tone"]].append(_conv)
+    _CONVERSATIONS_BY_LENGTH[_conv["length"]].append(_conv)
 
+_CONVERSATION_BY_ID: dict[str, dict] = {conv["id"]: conv for conv in IDEAL_CONVERSATIONS}
 
-def get_all_test_cases() -> list[dict]:
-    """
-    DEPRECATED: Use get_all_conversations instead.
-    Retrieve all test cases (backwards compatible).
-    """
-    return get_all_conversations()
+_MULTI_TURN_CONVERSATIONS: list[dict] = [
+    conv for conv in IDEAL_CONVERSATIONS if len(conv["conversation"]) > 2
+]
+_SINGLE_TURN_CONVERSATIONS: list[dict] = [
+    conv for conv in IDEAL_CONVERSATIONS if len(conv["conversation"]) == 2
+]
 
+# Refinement type -> example conversation, and purpose -> first multi-turn conversation
+_REFINEMENT_EXAMPLE_BY_TYPE: dict[str, dict] = {}
+for _refinement_type, _keywords in _REFINEMENT_KEYWORDS.items():
+    _example = _find_refinement_example(_keywords)
+    if _example is not None:
+        _REFINEMENT_EXAMPLE_BY_TYPE[_refinement_type] = _example
 
-# Alias for backwards compatibility
-IDEAL_TEST_CASES = IDEAL_CONVERSATIONS
+_MULTI_TURN_BY_PURPOSE: dict[PurposeEnum, dict] = {}
+for _conv in _MULTI_TURN_CONVERSATIONS:
+    _MULTI_TURN_BY_PURPOSE.setdefault(_conv["purpose"], _conv)
+
+_FINAL_EMAIL_BY_ID: dict[str, dict | None] = {
+    conv["id"]: _scan_emails(conv, get_final=True) for conv in IDEAL_CONVERSATIONS
+}
+
+# (conversation ID, include_notes) -> prompt text
+_FORMATTED_PROMPT_BY_ID: dict[tuple[str, bool], str] = {
+    (conv["id"], include_notes): _render_conversation(conv, include_notes)
+    for conv in IDEAL_CONVERSATIONS
+    for include_notes in (False, True)
+}
+
+
+class _RetrievalFeatures(NamedTuple):
+    """Fields the retrieval scorers read, extracted once per conversation."""
+    purpose: PurposeEnum
+    tone: ToneEnum
+    length: LengthEnum
+    tags_lower: tuple[str, ...]
+    scenario_words: frozenset[str]
+    first_msg_words: frozenset[str]
+
+
+def _first_message_words(conversation: dict) -> frozenset[str]:
+    """Lowercased words of a conversation's opening user message."""
+    if not conversation["conversation"]:
+        return frozenset()
+    return frozenset(conversation["conversation"][0].get("content", "").lower().split())
+
+
+# Aligned with IDEAL_CONVERSATIONS by position
+_RETRIEVAL_FEATURES: list[_RetrievalFeatures] = [
+    _RetrievalFeatures(
+        purpose=conv["purpose"],
+        tone=conv["tone"],
+        length=conv["length"],
+        tags_lower=tuple(tag.lower() for tag in conv.get("tags", [])),
+        scenario_words=frozenset(conv.get("scenario", "").lower().split()),
+        first_msg_words=_first_message_words(conv),
+    )
+    for conv in IDEAL_CONVERSATIONS
+]
+
+# Lowercased tag -> positions of the conversations carrying it
+_TAG_INDEX: dict[str, list[int]] = {}
+for _position, _features in enumerate(_RETRIEVAL_FEATURES):
+    for _tag in dict.fromkeys(_features.tags_lower):
+        _TAG_INDEX.setdefault(_tag, []).append(_position)
+
+# Keyword-to-tag substring matching. A tag slot is a (position, tag number) pair,
+# so a tag listed twice on a conversation still counts twice.
+# Whole lowercased tag -> slots holding it
+_TAG_SLOT_INDEX: dict[str, list[tuple[int, int]]] = {}
+# Every substring longer than 3 characters (the shortest keyword scored) -> slots whose tag contains it
+_TAG_SUBSTRING_INDEX: dict[str, list[tuple[int, int]]] = {}
+for _position, _features in enumerate(_RETRIEVAL_FEATURES):
+    for _slot, _tag in enumerate(_features.tags_lower):
+        _TAG_SLOT_INDEX.setdefault(_tag, []).append((_position, _slot))
+        _substrings = {
+            _tag[_start:_end]
+            for _start in range(len(_tag))
+            for _end in range(_start + 4, len(_tag) + 1)
+        }
+        for _substring in _substrings:
+            _TAG_SUBSTRING_INDEX.setdefault(_substring, []).append((_position, _slot))
+
+_TAG_LENGTHS: tuple[int, ...] = tuple(sorted({len(tag) for tag in _TAG_SLOT_INDEX}))
+
+
+# =============================================================================
+# PRECOMPUTED API PAYLOADS
+# =============================================================================
+# The conversations are static, so the /evaluation/test-cases responses are
+# serialized once at import instead of being rebuilt on every request.
+
+def _test_case_payload(conversation: dict) -> dict:
+    """Flatten a conversation into the test-case shape served by the API."""
+    return {
+        "id": conversation["id"],
+        "purpose": conversation["purpose"].value,
+        "tone": conversation["tone"].value,
+        "length": conversation["length"].value,
+        "input_details": conversation["conversation"][0]["content"],
+        "ideal_email": extract_email_from_conversation(conversation),
+        "evaluation_notes": conversation["evaluation_notes"],
+    }
+
+
+_TEST_CASE_PAYLOADS = [_test_case_payload(conv) for conv in IDEAL_CONVERSATIONS]
+
+TEST_CASES_JSON = orjson.dumps({
+    "count": len(_TEST_CASE_PAYLOADS),
+    "test_cases": _TEST_CASE_PAYLOADS,
+})
+
+TEST_CASE_BY_ID_JSON = {payload["id"]: orjson.dumps(payload) for payload in _TEST_CASE_PAYLOADS}
@@ -10,6 +10,7 @@ from datetime import datetime
 
 from app.api.routes import router
 from app.config import get_settings
+from app.services.http_client import get_http_client, close_http_client
 
 
 # Setup log directory
@@ -99,6 +100,7 @@ async def serve_frontend():
 @app.on_event("startup")
 async def startup_event():
     settings = get_settings()
+    get_http_client()
     logger.info(
         "FMG Muse starting up",
         model=settings.openrouter_model,
@@ -109,8 +111,11 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("FMG Muse shutting down")
+    await close_http_client()
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # "auto" picks uvloop and httptools when installed (uvicorn[standard]) and falls
+    # back to asyncio/h11 elsewhere, e.g. on Windows where uvloop is unavailable
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto")
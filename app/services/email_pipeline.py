@@ -15,7 +15,6 @@ from app.models.email import (
     UsageInfo,
 )
 from app.services.llm_service import get_llm_service
-from app.evaluation.evaluation_service import get_evaluation_service
 
 logger = structlog.get_logger()
 
@@ -43,7 +42,15 @@ class EmailPipeline:
 
     def __init__(self):
         self.llm_service = get_llm_service()
-        self.eval_service = get_evaluation_service()
+        self._eval_service = None
+
+    @property
+    def eval_service(self):
+        """Evaluation service, loaded on first use (skipped entirely when evaluation is disabled)."""
+        if self._eval_service is None:
+            from app.evaluation.evaluation_service import get_evaluation_service
+            self._eval_service = get_evaluation_service()
+        return self._eval_service
 
     def _needs_refinement(self, metrics) -> tuple[bool, list[str]]:
         """
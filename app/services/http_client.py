@@ -0,0 +1,35 @@
+"""
+Shared HTTP client for outbound OpenRouter calls.
+One pooled AsyncClient is reused across requests so TCP/TLS handshakes are paid once.
+"""
+
+from typing import Optional
+
+import httpx
+
+
+# Pool sizing and timeouts: fail fast on connect, allow slow upstream reads
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=2.0)
+
+# Per-request override for chat completions, which can take longer than the pool default to return
+LLM_TIMEOUT = httpx.Timeout(60.0, connect=2.0)
+
+# Shared client instance (created lazily or at app startup)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP/2 client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -1,6 +1,6 @@
 import structlog
 import httpx
-import json
+import orjson
 import asyncio
 from typing import Optional, AsyncGenerator
 
@@ -14,6 +14,7 @@ from app.models.email import (
     UsageInfo,
 )
 from app.config import get_settings
+from app.services.http_client import LLM_TIMEOUT, get_http_client
 from app.services.prompt_service import (
     SYSTEM_PROMPT,
     construct_generation_prompt,
@@ -72,69 +73,66 @@ class OpenRouterLLMService:
             payload["reasoning"] = {"effort": "minimal"}
 
         try:
-            # Timeout for API calls (reduced since reasoning is disabled)
-            timeout = 60.0
+            logger.info(
+                "Calling OpenRouter API",
+                model=effective_model,
+                attempt=attempt,
+                max_attempts=max_attempts,
+                temperature=payload["temperature"],
+                reasoning_disabled="gpt-5" in effective_model.lower(),
+            )
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                logger.info(
-                    "Calling OpenRouter API",
-                    model=effective_model,
-                    attempt=attempt,
-                    max_attempts=max_attempts,
-                    temperature=payload["temperature"],
-                    reasoning_disabled="gpt-5" in effective_model.lower(),
-                )
+            response = await get_http_client().post(
+                f"{self.base_url}/chat/completions",
+                headers=self.headers,
+                content=orjson.dumps(payload),
+                timeout=LLM_TIMEOUT,
+            )
 
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=self.headers,
-                    json=payload,
+            if response.status_code != 200:
+                error_detail = response.text
+                logger.error(
+                    "OpenRouter API error",
+                    status_code=response.status_code,
+                    error=error_detail,
+                    attempt=attempt,
                 )
+                raise Exception(f"OpenRouter API error: {response.status_code} - {error_detail}")
 
-                if response.status_code != 200:
-                    error_detail = response.text
-                    logger.error(
-                        "OpenRouter API error",
-                        status_code=response.status_code,
-                        error=error_detail,
-                        attempt=attempt,
-                    )
-                    raise Exception(f"OpenRouter API error: {response.status_code} - {error_detail}")
+            result = orjson.loads(response.content)
 
-                result = response.json()
+            # Debug: Log full response structure
+            logger.info(
+                "OpenRouter raw response",
+                response_keys=list(result.keys()) if isinstance(result, dict) else "not_dict",
+                full_response=str(result)[:500],  # First 500 chars
+            )
 
-                # Debug: Log full response structure
-                logger.info(
-                    "OpenRouter raw response",
-                    response_keys=list(result.keys()) if isinstance(result, dict) else "not_dict",
-                    full_response=str(result)[:500],  # First 500 chars
+            # Check if response has expected structure
+            if "choices" not in result or not result["choices"]:
+                logger.error("OpenRouter response missing 'choices'", response=result)
+                raise EmptyResponseError("Invalid response structure - no choices")
+
+            content = result["choices"][0].get("message", {}).get("content", "")
+
+            # Extract usage information
+            usage = result.get("usage", {})
+            usage_info = {
+                "prompt_tokens": usage.get("prompt_tokens", 0),
+                "completion_tokens": usage.get("completion_tokens", 0),
+                "total_tokens": usage.get("total_tokens", 0),
+            }
+
+            # Check for empty response
+            if not content or not content.strip():
+                logger.warning(
+                    "OpenRouter returned empty response",
+                    model=effective_model,
+                    attempt=attempt,
                 )
+                raise EmptyResponseError("LLM returned empty response")
 
-                # Check if response has expected structure
-                if "choices" not in result or not result["choices"]:
-                    logger.error("OpenRouter response missing 'choices'", response=result)
-                    raise EmptyResponseError("Invalid response structure - no choices")
-
-                content = result["choices"][0].get("message", {}).get("content", "")
-
-                # Extract usage information
-                usage = result.get("usage", {})
-                usage_info = {
-                    "prompt_tokens": usage.get("prompt_tokens", 0),
-                    "completion_tokens": usage.get("completion_tokens", 0),
-                    "total_tokens": usage.get("total_tokens", 0),
-                }
-
-                # Check for empty response
-                if not content or not content.strip():
-                    logger.warning(
-                        "OpenRouter returned empty response",
-                        model=effective_model,
-                        attempt=attempt,
-                    )
-                    raise EmptyResponseError("LLM returned empty response")
-
-                return content, usage_info
+            return content, usage_info
 
         except (httpx.TimeoutException, httpx.ConnectError) as e:
             logger.warning(
@@ -213,37 +211,34 @@ class OpenRouterLLMService:
             temperature=payload["temperature"],
         )
 
-        # Timeout for streaming
-        timeout = 60.0
-
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            async with client.stream(
-                "POST",
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-            ) as response:
-                if response.status_code != 200:
-                    error_text = await response.aread()
-                    logger.error(
-                        "OpenRouter streaming API error",
-                        status_code=response.status_code,
-                        error=error_text.decode(),
-                    )
-                    raise Exception(f"OpenRouter API error: {response.status_code}")
-
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data = line[6:]  # Remove "data: " prefix
-                        if data == "[DONE]":
-                            break
-                        try:
-                            chunk = json.loads(data)
-                            if chunk["choices"] and chunk["choices"][0].get("delta", {}).get("content"):
-                                content = chunk["choices"][0]["delta"]["content"]
-                                yield content
-                        except json.JSONDecodeError:
-                            continue
+        async with get_http_client().stream(
+            "POST",
+            f"{self.base_url}/chat/completions",
+            headers=self.headers,
+            content=orjson.dumps(payload),
+            timeout=LLM_TIMEOUT,
+        ) as response:
+            if response.status_code != 200:
+                error_text = await response.aread()
+                logger.error(
+                    "OpenRouter streaming API error",
+                    status_code=response.status_code,
+                    error=error_text.decode(),
+                )
+                raise Exception(f"OpenRouter API error: {response.status_code}")
+
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    data = line[6:]  # Remove "data: " prefix
+                    if data == "[DONE]":
+                        break
+                    try:
+                        chunk = orjson.loads(data)
+                        if chunk["choices"] and chunk["choices"][0].get("delta", {}).get("content"):
+                            content = chunk["choices"][0]["delta"]["content"]
+                            yield content
+                    except orjson.JSONDecodeError:
+                        continue
 
     async def generate_email_stream(
         self,
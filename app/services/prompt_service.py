@@ -1,3 +1,4 @@
+import re
 from pathlib import Path
 from app.models.email import PurposeEnum, LengthEnum, ToneEnum
 from app.evaluation.test_cases import (
@@ -16,8 +17,12 @@ def load_compliance_rules() -> str:
         return ""
 
 
+# The rulebook file is static, so it is read once at import
+COMPLIANCE_RULES = load_compliance_rules()
+
+
 # Shorter, more direct system prompt for GPT-5 Nano
-SYSTEM_PROMPT = """You are an email writer. Generate emails in this exact format:
+_BASE_SYSTEM_PROMPT = """You are an email writer. Generate emails in this exact format:
 
 Subject: [subject line]
 
@@ -31,6 +36,15 @@ Rules:
 5. Write emails with clear placeholders that users can easily identify and fill in themselves
 6. Output ONLY the email - no explanations or commentary"""
 
+# The rulebook is the largest invariant part of every request. Keeping it in
+# the system message puts it ahead of the history and per-request prompt, so
+# provider-side prefix caching can reuse it across calls.
+SYSTEM_PROMPT = (
+    f"{_BASE_SYSTEM_PROMPT}\n\nCOMPLIANCE RULEBOOK:\n{COMPLIANCE_RULES}"
+    if COMPLIANCE_RULES
+    else _BASE_SYSTEM_PROMPT
+)
+
 
 # Simplified purpose descriptions for clearer instructions
 PURPOSE_INSTRUCTIONS = {
@@ -194,15 +208,12 @@ COMPLIANCE WORKFLOW (you MUST follow this process):
 
 1. GENERATE: First, draft the email based on user input above.
 
-2. CHECK: Review your draft against EACH rule in the compliance rulebook below. Go through every rule.
+2. CHECK: Review your draft against EACH rule in the compliance rulebook from the system instructions. Go through every rule.
 
 3. FIX: If ANY rule is violated, rewrite the email to fix the violation.
 
 4. OUTPUT: Only output the final compliant email. No explanations, no compliance notes.
 
-COMPLIANCE RULEBOOK:
-{load_compliance_rules()}
-
 ---
 
 Now generate a compliant email. Output ONLY the final email, nothing else."""
@@ -210,6 +221,17 @@ Now generate a compliant email. Output ONLY the final email, nothing else."""
     return prompt
 
 
+# Feedback keywords per refinement type, checked in order; one alternation scan per type
+REFINEMENT_TYPE_PATTERNS = tuple(
+    (refinement_type, re.compile("|".join(map(re.escape, keywords))))
+    for refinement_type, keywords in (
+        ("shorter", ["shorter", "brief", "concise"]),
+        ("more_detail", ["longer", "more detail", "expand", "elaborate"]),
+        ("tone_change", ["formal", "friendly", "casual", "warm", "tone", "stiff"]),
+    )
+)
+
+
 def construct_refinement_prompt(
     original_subject: str,
     original_body: str,
@@ -230,12 +252,10 @@ def construct_refinement_prompt(
     # Detect refinement type from feedback
     feedback_lower = feedback.lower()
     refinement_type = None
-    if any(word in feedback_lower for word in ["shorter", "brief", "concise"]):
-        refinement_type = "shorter"
-    elif any(word in feedback_lower for word in ["longer", "more detail", "expand", "elaborate"]):
-        refinement_type = "more_detail"
-    elif any(word in feedback_lower for word in ["formal", "friendly", "casual", "warm", "tone", "stiff"]):
-        refinement_type = "tone_change"
+    for candidate_type, pattern in REFINEMENT_TYPE_PATTERNS:
+        if pattern.search(feedback_lower):
+            refinement_type = candidate_type
+            break
 
     # Build refinement example section
     example_section = ""
@@ -282,15 +302,12 @@ COMPLIANCE WORKFLOW (you MUST follow this process):
 
 1. GENERATE: First, rewrite the email based on user feedback above.
 
-2. CHECK: Review your draft against EACH rule in the compliance rulebook below. Go through every rule.
+2. CHECK: Review your draft against EACH rule in the compliance rulebook from the system instructions. Go through every rule.
 
 3. FIX: If ANY rule is violated, rewrite the email to fix the violation.
 
 4. OUTPUT: Only output the final compliant email. No explanations, no compliance notes.
 
-COMPLIANCE RULEBOOK:
-{load_compliance_rules()}
-
 ---
 
 Now generate a compliant revised email. Output ONLY the final email, nothing else."""
@@ -0,0 +1,51 @@
+"""
+In-process response cache for LLM-backed endpoints.
+Identical requests within the TTL window are served without another upstream call.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import orjson
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Hash request fields into a compact cache key."""
+    return hashlib.blake2b(orjson.dumps(parts), digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """LRU cache whose entries expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int = 256, ttl_seconds: float = 600.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl_seconds:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -0,0 +1,4 @@
+import os
+
+# The services refuse to start without a key; tests never reach the network
+os.environ.setdefault("OPENROUTER_API_KEY", "test-key")
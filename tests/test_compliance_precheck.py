@@ -0,0 +1,91 @@
+import asyncio
+
+import orjson
+import pytest
+
+from app.evaluation import evaluation_service as es
+from app.models.email import PurposeEnum, ToneEnum, LengthEnum
+
+
+@pytest.mark.parametrize("text", [
+    "Returns cannot be guaranteed.",
+    "Investments are not FDIC insured or bank guaranteed and may lose value.",
+    "Past performance is no guarantee of future results.",
+    "Deposits are FDIC-insured and government guaranteed up to applicable limits.",
+    "Given your limited time horizon, a conservative allocation may fit.",
+    "Please contact now or next week, whichever suits you.",
+    "The impact now is small.",
+    "Nothing here is risk-free, and you can lose money.",
+])
+def test_disclaimers_and_lookalikes_are_not_flagged(text):
+    assert es.find_compliance_triggers(text) == []
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Your returns are guaranteed!", ["guaranteed"]),
+    ("This strategy is risk-free.", ["risk-free"]),
+    ("This is a risk free way to grow.", ["risk-free"]),
+    ("You can't lose with this fund.", ["cannot lose"]),
+    ("Act now, this is a limited time offer!", ["act now", "limited time"]),
+    ("Available for a limited time.", ["limited time"]),
+    ("This is your last chance to join.", ["last chance"]),
+    ("We will definitely beat the market.", ["will definitely"]),
+    ("We are not sure about timing, but returns are guaranteed.", ["guaranteed"]),
+])
+def test_affirmative_promises_are_flagged(text, expected):
+    assert es.find_compliance_triggers(text) == expected
+
+
+def _service(monkeypatch, precheck: bool) -> es.EmailEvaluationService:
+    service = es.EmailEvaluationService()
+    service.eval_mode = "parallel"
+    service.compliance_precheck = precheck
+    service.requested_metrics = []
+
+    async def fake_request(prompt, model, max_tokens=es.BATCHED_MAX_TOKENS, response_format=None):
+        service.requested_metrics.append(prompt[0]["text"].split("=== METRIC: ")[1].split(" ===")[0])
+        return orjson.dumps({"score": 9, "justification": "good", "suggestions": None}).decode()
+
+    monkeypatch.setattr(service, "_request_evaluation", fake_request)
+    return service
+
+
+def _evaluate(service, body):
+    return asyncio.run(service.evaluate_email(
+        "Market update", body, PurposeEnum.FOLLOW_UP, ToneEnum.PROFESSIONAL, LengthEnum.SHORT, "req",
+    ))
+
+
+def test_precheck_is_off_by_default():
+    assert es.get_settings().eval_compliance_precheck is False
+
+
+def test_disclaimer_does_not_fail_compliance(monkeypatch):
+    service = _service(monkeypatch, precheck=True)
+    metrics = _evaluate(service, "Returns cannot be guaranteed. " * 10)
+
+    assert metrics.compliance.score == 9
+    assert "REGULATORY COMPLIANCE" in service.requested_metrics
+
+
+def test_trigger_skips_compliance_call_but_keeps_evaluated_scores(monkeypatch):
+    service = _service(monkeypatch, precheck=True)
+    metrics = _evaluate(service, "Your returns are guaranteed. " * 15)
+
+    assert metrics.compliance.score == 2
+    assert "REGULATORY COMPLIANCE" not in service.requested_metrics
+    assert len(service.requested_metrics) == len(es.LLM_METRIC_NAMES) - 1
+    assert metrics.rewrite_recommended is True
+    assert '"guaranteed"' in metrics.improvements_needed[0]
+    # Every other LLM metric is a real evaluation, never a placeholder
+    for name in es.LLM_METRIC_NAMES:
+        if name != "compliance":
+            assert getattr(metrics, name).score == 9
+
+
+def test_trigger_ignored_when_precheck_disabled(monkeypatch):
+    service = _service(monkeypatch, precheck=False)
+    metrics = _evaluate(service, "Your returns are guaranteed. " * 15)
+
+    assert metrics.compliance.score == 9
+    assert len(service.requested_metrics) == len(es.LLM_METRIC_NAMES)
@@ -0,0 +1,68 @@
+import asyncio
+
+import orjson
+
+from app.evaluation import evaluation_service as es
+from app.models.email import EmailEvaluationRequest, LengthEnum, PurposeEnum, ToneEnum
+
+_EVALUATION_JSON = orjson.dumps({
+    **{name: {"score": 8, "justification": "fine", "suggestions": None} for name in es.LLM_METRIC_NAMES},
+    "strengths": ["Clear"],
+    "improvements_needed": [],
+}).decode()
+
+
+def _item(subject):
+    return EmailEvaluationRequest(
+        subject=subject,
+        body="Body " * 60,
+        purpose=PurposeEnum.FOLLOW_UP,
+        tone=ToneEnum.PROFESSIONAL,
+        length=LengthEnum.SHORT,
+        original_request="Follow up",
+    )
+
+
+def _service(monkeypatch, failing_subject=None):
+    service = es.EmailEvaluationService()
+    service.eval_mode = "parallel"
+    stats = {"calls": 0, "in_flight": 0, "peak": 0}
+
+    async def fake_request(prompt, model, max_tokens=es.BATCHED_MAX_TOKENS, response_format=None):
+        stats["calls"] += 1
+        stats["in_flight"] += 1
+        stats["peak"] = max(stats["peak"], stats["in_flight"])
+        try:
+            await asyncio.sleep(0.01)
+            if failing_subject and f"Subject: {failing_subject}\n" in prompt[-1]["text"]:
+                raise RuntimeError("upstream down")
+            return _EVALUATION_JSON
+        finally:
+            stats["in_flight"] -= 1
+
+    monkeypatch.setattr(service, "_request_evaluation", fake_request)
+    return service, stats
+
+
+def test_batch_uses_one_bounded_call_per_email(monkeypatch):
+    service, stats = _service(monkeypatch)
+    items = [_item(f"Email {index}") for index in range(10)]
+
+    results = asyncio.run(service.evaluate_email_batch(items))
+
+    assert [metrics.compliance.score for metrics in results] == [8] * 10
+    # Single-prompt evaluation even though the service default is parallel mode
+    assert stats["calls"] == 10
+    assert stats["peak"] == es.MAX_CONCURRENT_BATCH_EVALUATIONS
+
+
+def test_batch_keeps_order_and_maps_failures_to_none(monkeypatch):
+    service, stats = _service(monkeypatch, failing_subject="Email 1")
+    items = [_item("Email 0"), _item("Email 1"), _item("Email 0")]
+
+    results = asyncio.run(service.evaluate_email_batch(items))
+
+    assert results[1] is None
+    assert results[0] is results[2]
+    # The duplicate email shares the first one's evaluation
+    assert stats["calls"] == 2
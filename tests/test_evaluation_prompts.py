@@ -0,0 +1,61 @@
+import pytest
+
+from app.evaluation import evaluation_service as es
+from app.models.email import LengthEnum, PurposeEnum, ToneEnum
+
+
+def _request(subject, body, purpose=PurposeEnum.FOLLOW_UP):
+    return dict(
+        email_subject=subject,
+        email_body=body,
+        purpose=purpose,
+        tone=ToneEnum.PROFESSIONAL,
+        length=LengthEnum.SHORT,
+        original_request="Follow up with the client",
+    )
+
+
+def _assert_static_first(build_content, **kwargs):
+    first = build_content(**kwargs, **_request("Hello", "First email body"))
+    second = build_content(**kwargs, **_request("Other subject", "A different body"))
+
+    # The cacheable prefix is identical across requests and carries the breakpoint
+    assert first[0] == second[0]
+    assert first[0]["cache_control"] == {"type": "ephemeral"}
+    # Only the trailing part holds the email under evaluation
+    assert "First email body" not in first[0]["text"]
+    assert "First email body" in first[1]["text"]
+    assert "cache_control" not in first[1]
+
+
+def test_evaluation_content_is_static_first():
+    _assert_static_first(es.build_evaluation_content)
+
+
+@pytest.mark.parametrize("metric_name", es.LLM_METRIC_NAMES)
+def test_metric_content_is_static_first(metric_name):
+    _assert_static_first(es.build_metric_content, metric_name=metric_name)
+
+
+@pytest.mark.parametrize("purpose", list(PurposeEnum))
+def test_prompts_include_reference_in_prefix(purpose):
+    reference = es._REFERENCE_BLOCK_BY_PURPOSE[purpose]
+    evaluation = es.build_evaluation_content(**_request("Hi", "Body", purpose))
+    metric = es.build_metric_content(metric_name="clarity", **_request("Hi", "Body", purpose))
+
+    assert evaluation[0]["text"].endswith(reference)
+    assert metric[0]["text"].endswith(reference)
+
+
+def test_metric_prompt_joins_content_parts():
+    kwargs = dict(metric_name="compliance", **_request("Hi", "Body"))
+    parts = es.build_metric_content(**kwargs)
+
+    assert es.build_metric_prompt(**kwargs) == parts[0]["text"] + parts[1]["text"]
+    assert es.build_metric_prompt(**kwargs).endswith("Evaluate the email now:")
+
+
+def test_locally_scored_metrics_have_no_prompt_prefix():
+    names = {name for name, _ in es._METRIC_PREFIX_BY_NAME_AND_PURPOSE}
+    assert names == set(es.LLM_METRIC_NAMES)
+    assert names.isdisjoint(es.LOCAL_METRICS)
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from app.evaluation import evaluation_service as es
+from app.models.email import LengthEnum, PurposeEnum, ToneEnum
+
+
+class _FakeEvaluator:
+    """Stands in for _evaluate_uncached; each call waits until released."""
+
+    def __init__(self, error=None):
+        self.calls = 0
+        self.error = error
+        self.release = asyncio.Event()
+
+    async def __call__(self, **kwargs):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return f"metrics for {kwargs['email_subject']}"
+
+
+def _service(monkeypatch, evaluator):
+    service = es.EmailEvaluationService()
+    monkeypatch.setattr(service, "_evaluate_uncached", evaluator)
+    return service
+
+
+def _evaluate(service, subject="Subject"):
+    return service.evaluate_email(
+        subject, "Body", PurposeEnum.FOLLOW_UP, ToneEnum.PROFESSIONAL, LengthEnum.SHORT, "req"
+    )
+
+
+def test_concurrent_identical_calls_share_one_evaluation(monkeypatch):
+    async def run():
+        evaluator = _FakeEvaluator()
+        service = _service(monkeypatch, evaluator)
+
+        waiters = [asyncio.create_task(_evaluate(service)) for _ in range(3)]
+        other = asyncio.create_task(_evaluate(service, "Other"))
+        await asyncio.sleep(0)
+        evaluator.release.set()
+
+        results = await asyncio.gather(*waiters, other)
+        assert results == ["metrics for Subject"] * 3 + ["metrics for Other"]
+        assert evaluator.calls == 2
+        assert service._inflight == {}
+
+        # The finished result is served from the cache
+        assert await _evaluate(service) == "metrics for Subject"
+        assert evaluator.calls == 2
+
+    asyncio.run(run())
+
+
+def test_cancelled_caller_does_not_cancel_shared_evaluation(monkeypatch):
+    async def run():
+        evaluator = _FakeEvaluator()
+        service = _service(monkeypatch, evaluator)
+
+        cancelled = asyncio.create_task(_evaluate(service))
+        survivor = asyncio.create_task(_evaluate(service))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        evaluator.release.set()
+        assert await survivor == "metrics for Subject"
+        assert evaluator.calls == 1
+
+    asyncio.run(run())
+
+
+def test_error_reaches_every_waiter_and_is_not_cached(monkeypatch):
+    async def run():
+        evaluator = _FakeEvaluator(error=RuntimeError("upstream down"))
+        service = _service(monkeypatch, evaluator)
+
+        waiters = [asyncio.create_task(_evaluate(service)) for _ in range(2)]
+        await asyncio.sleep(0)
+        evaluator.release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert evaluator.calls == 1
+        assert service._inflight == {}
+
+        # A failed evaluation is retried rather than served from the cache
+        evaluator.error = None
+        assert await _evaluate(service) == "metrics for Subject"
+        assert evaluator.calls == 2
+
+    asyncio.run(run())
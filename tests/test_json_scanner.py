@@ -0,0 +1,44 @@
+import pytest
+
+from app.evaluation.evaluation_service import _JsonObjectScanner
+
+
+def _feed_all(chunks):
+    """Feed chunks in order; return the index of the chunk that completed the object."""
+    scanner = _JsonObjectScanner()
+    for index, chunk in enumerate(chunks):
+        if scanner.feed(chunk):
+            return index
+    return None
+
+
+def test_detects_end_of_nested_object():
+    assert _feed_all(['{"compliance": {"score": 8}', ', "clarity": {"score": 7}}', " trailing"]) == 1
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"justification": "uses {braces} and }"}',
+        '{"suggestions": "close with a }"}',
+        '{"justification": "escaped \\" quote }"}',
+        '{"justification": "backslash at end \\\\"}',
+    ],
+)
+def test_braces_inside_strings_are_ignored(text):
+    scanner = _JsonObjectScanner()
+    assert not scanner.feed(text[:-1])
+    assert scanner.feed(text[-1])
+
+
+def test_escape_split_across_chunks():
+    assert _feed_all(['{"a": "x\\', '"}', '"}']) == 2
+
+
+def test_prose_before_object_is_ignored():
+    # Quotes and closing braces ahead of the object must not confuse the scanner
+    assert _feed_all(['Here is the "result" } ', '```json\n{"score": 9}', "\n```"]) == 1
+
+
+def test_incomplete_object_never_completes():
+    assert _feed_all(['{"score": 9, "justification": "ok}"']) is None
@@ -0,0 +1,60 @@
+import pytest
+
+from app.evaluation.metrics import EVALUATION_CRITERIA, LENGTH_WORD_RANGES, score_length_accuracy
+from app.evaluation.test_cases import IDEAL_CONVERSATIONS, extract_email_from_conversation
+
+
+def _body(word_count):
+    return " ".join(["word"] * word_count)
+
+
+def test_word_ranges_match_length_targets():
+    targets = EVALUATION_CRITERIA["length_accuracy"]["length_targets"]
+
+    assert LENGTH_WORD_RANGES.keys() == targets.keys()
+    for length, (low, high) in LENGTH_WORD_RANGES.items():
+        assert targets[length].startswith(f"{low}-{high} words")
+
+
+@pytest.mark.parametrize(
+    "word_count, expected",
+    [
+        # Inside the short (50-100) range, bounds included
+        (50, 10),
+        (75, 10),
+        (100, 10),
+        # Deviation measured from the nearest bound
+        (45, 8),    # 10% under
+        (110, 8),   # 10% over
+        (44, 6),    # 12% under
+        (38, 6),    # 24% under
+        (125, 6),   # 25% over
+        (126, 4),
+        (25, 4),    # 50% under
+        (150, 4),   # 50% over
+        (24, 2),
+        (199, 2),
+        (200, 1),   # double the upper bound
+        (0, 1),
+    ],
+)
+def test_deviation_to_score_mapping(word_count, expected):
+    assert score_length_accuracy(_body(word_count), "short").score == expected
+
+
+def test_suggestion_only_below_eight():
+    assert score_length_accuracy(_body(45), "short").suggestions is None
+    assert score_length_accuracy(_body(30), "short").suggestions == "Expand the body to 50-100 words."
+    assert score_length_accuracy(_body(300), "medium").suggestions == "Trim the body to 100-200 words."
+
+
+def test_ideal_emails_score_acceptable_or_better():
+    scores = {}
+    for conversation in IDEAL_CONVERSATIONS:
+        email = extract_email_from_conversation(conversation)
+        scores[conversation["id"]] = score_length_accuracy(email["body"], conversation["length"].value).score
+
+    # TC013 (38 words, short) and TC017 (82 words, medium) fall within 25% of their range
+    assert scores.pop("TC013") == 6
+    assert scores.pop("TC017") == 6
+    assert set(scores.values()) == {10}
@@ -0,0 +1,63 @@
+import pytest
+
+from app.services import response_cache
+from app.services.response_cache import ResponseCache, make_cache_key
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = ResponseCache(maxsize=4, ttl_seconds=10)
+    cache.set("key", "value")
+
+    clock[0] += 9.9
+    assert cache.get("key") == "value"
+
+    clock[0] += 0.1
+    assert cache.get("key") is None
+    assert "key" not in cache._entries
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_set_refreshes_ttl(clock):
+    cache = ResponseCache(maxsize=4, ttl_seconds=10)
+    cache.set("key", "old")
+    clock[0] += 8
+    cache.set("key", "new")
+    clock[0] += 8
+
+    assert cache.get("key") == "new"
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ResponseCache(maxsize=2, ttl_seconds=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_overwrite_does_not_evict(clock):
+    cache = ResponseCache(maxsize=2, ttl_seconds=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 3)
+
+    assert cache.get("a") == 3
+    assert cache.get("b") == 2
+
+
+def test_cache_key_is_stable_and_field_sensitive():
+    assert make_cache_key("model", "short", "details") == make_cache_key("model", "short", "details")
+    assert make_cache_key("model", "short", "details") != make_cache_key("model", "shortdetails", "")
+    assert make_cache_key("model", None) != make_cache_key("model", "")
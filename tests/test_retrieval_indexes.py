@@ -0,0 +1,168 @@
+"""The import-time lookup indexes must return exactly what a full scan of IDEAL_CONVERSATIONS would."""
+
+import random
+import string
+
+import pytest
+
+from app.evaluation import test_cases as tc
+from app.models.email import LengthEnum, PurposeEnum, ToneEnum
+
+
+# =============================================================================
+# REFERENCE IMPLEMENTATIONS (full scans)
+# =============================================================================
+
+def _scan_tag_hits(user_words):
+    hits = {}
+    for position, conv in enumerate(tc.IDEAL_CONVERSATIONS):
+        count = 0
+        for word in user_words:
+            if len(word) > 3:
+                for tag in conv.get("tags", []):
+                    if word in tag.lower() or tag.lower() in word:
+                        count += 1
+        if count:
+            hits[position] = count
+    return hits
+
+
+def _scan_search_by_tags(search_tags, match_all):
+    results = []
+    search_tags_lower = [tag.lower() for tag in search_tags]
+    for conv in tc.IDEAL_CONVERSATIONS:
+        conv_tags_lower = [tag.lower() for tag in conv.get("tags", [])]
+        matching = [tag for tag in search_tags_lower if tag in conv_tags_lower]
+        if (match_all and len(matching) == len(search_tags_lower)) or (not match_all and matching):
+            results.append((conv, len(matching)))
+    results.sort(key=lambda item: item[1], reverse=True)
+    return [conv for conv, _ in results]
+
+
+def _scan_similar(purpose, tone, length, user_input, max_results):
+    scored = []
+    user_words = set(user_input.lower().split())
+    hits = _scan_tag_hits(user_words)
+    for position, conv in enumerate(tc.IDEAL_CONVERSATIONS):
+        score = 0
+        if conv["purpose"] == purpose:
+            score += 10
+        if conv["tone"] == tone:
+            score += 5
+        if conv["length"] == length:
+            score += 3
+        score += hits.get(position, 0) * 2
+        score += len(user_words & set(conv.get("scenario", "").lower().split())) * 1.5
+        if conv["conversation"]:
+            first_msg = conv["conversation"][0].get("content", "").lower()
+            score += len(user_words & set(first_msg.split())) * 2
+        if score > 0:
+            scored.append((conv, score))
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return [conv for conv, _ in scored[:max_results]]
+
+
+def _random_words(rng, tags):
+    words = set()
+    for _ in range(rng.randint(0, 6)):
+        tag = rng.choice(tags)
+        roll = rng.random()
+        if roll < 0.3:
+            start = rng.randint(0, len(tag))
+            words.add(tag[start:rng.randint(start, len(tag))])
+        elif roll < 0.6:
+            words.add(rng.choice(string.ascii_lowercase) + tag + rng.choice(["", "s", "-plan"]))
+        else:
+            words.add("".join(rng.choices(string.ascii_lowercase + "-", k=rng.randint(1, 10))))
+    return words
+
+
+_ALL_TAGS = sorted({tag.lower() for conv in tc.IDEAL_CONVERSATIONS for tag in conv.get("tags", [])})
+
+
+# =============================================================================
+# TAG MATCHING
+# =============================================================================
+
+def test_tag_keyword_hits_match_full_scan():
+    rng = random.Random(7)
+    for _ in range(2000):
+        words = _random_words(rng, _ALL_TAGS)
+        assert tc._tag_keyword_hits(words) == _scan_tag_hits(words), words
+
+
+def test_short_words_never_hit():
+    assert tc._tag_keyword_hits({tag[:3] for tag in _ALL_TAGS}) == {}
+
+
+@pytest.mark.parametrize("match_all", [False, True])
+def test_search_by_tags_matches_full_scan(match_all):
+    rng = random.Random(11)
+    for _ in range(500):
+        search = rng.sample(_ALL_TAGS, rng.randint(0, 3)) + rng.choice([[], ["missing-tag"]])
+        search = [tag.upper() if rng.random() < 0.3 else tag for tag in search]
+        assert tc.search_conversations_by_tags(search, match_all) == _scan_search_by_tags(search, match_all)
+
+
+# =============================================================================
+# SIMILARITY RANKING
+# =============================================================================
+
+def test_find_similar_matches_full_scan():
+    rng = random.Random(3)
+    inputs = [conv["conversation"][0]["content"] for conv in tc.IDEAL_CONVERSATIONS]
+    inputs += [" ".join(_random_words(rng, _ALL_TAGS)) for _ in range(50)]
+    for user_input in inputs:
+        purpose = rng.choice(list(PurposeEnum))
+        tone = rng.choice(list(ToneEnum))
+        length = rng.choice(list(LengthEnum))
+        max_results = rng.randint(1, 5)
+        expected = _scan_similar(purpose, tone, length, user_input, max_results)
+        assert tc.find_similar_conversations(purpose, tone, length, user_input, max_results) == expected
+
+
+def test_find_similar_returns_fresh_list():
+    first = tc.find_similar_conversations(PurposeEnum.FOLLOW_UP, ToneEnum.PROFESSIONAL, LengthEnum.SHORT, "meeting")
+    first.clear()
+    again = tc.find_similar_conversations(PurposeEnum.FOLLOW_UP, ToneEnum.PROFESSIONAL, LengthEnum.SHORT, "meeting")
+    assert again
+
+
+# =============================================================================
+# DIRECT LOOKUPS
+# =============================================================================
+
+def test_attribute_lookups_match_full_scan():
+    for purpose in PurposeEnum:
+        expected = [conv for conv in tc.IDEAL_CONVERSATIONS if conv["purpose"] == purpose]
+        assert tc.get_conversations_by_purpose(purpose) == expected
+    for tone in ToneEnum:
+        expected = [conv for conv in tc.IDEAL_CONVERSATIONS if conv["tone"] == tone]
+        assert tc.get_conversations_by_tone(tone) == expected
+    for length in LengthEnum:
+        expected = [conv for conv in tc.IDEAL_CONVERSATIONS if conv["length"] == length]
+        assert tc.get_conversations_by_length(length) == expected
+
+
+def test_id_and_turn_lookups_match_full_scan():
+    for conv in tc.IDEAL_CONVERSATIONS:
+        assert tc.get_conversation_by_id(conv["id"]) is conv
+    assert tc.get_conversation_by_id("TC999") is None
+    assert tc.get_multi_turn_conversations() == [
+        conv for conv in tc.IDEAL_CONVERSATIONS if len(conv["conversation"]) > 2
+    ]
+    assert tc.get_single_turn_conversations() == [
+        conv for conv in tc.IDEAL_CONVERSATIONS if len(conv["conversation"]) == 2
+    ]
+
+
+def test_precomputed_final_email_matches_scan():
+    for conv in tc.IDEAL_CONVERSATIONS:
+        emails = [
+            {"subject": msg["email_subject"], "body": msg["email_body"]}
+            for msg in conv["conversation"]
+            if msg.get("email_subject") and msg.get("email_body")
+        ]
+        assert tc.extract_email_from_conversation(conv) == (emails[-1] if emails else None)
+        # A copy is not the indexed conversation, so it is scanned rather than looked up
+        assert tc.extract_email_from_conversation(dict(conv)) == (emails[-1] if emails else None)
@@ -0,0 +1,70 @@
+import asyncio
+
+from app.api import routes
+from app.models.email import (
+    EmailGenerationRequest,
+    EmailGenerationResponse,
+    EmailRefineRequest,
+    EmailRefineResponse,
+    LengthEnum,
+    PurposeEnum,
+    UsageInfo,
+)
+
+_USAGE = UsageInfo(prompt_tokens=100, completion_tokens=50, total_tokens=150, cost=0.002)
+
+
+class _FakePipeline:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_with_quality_check(self, **fields):
+        self.calls += 1
+        return EmailGenerationResponse(subject="Hello", body="Body", usage=_USAGE)
+
+
+class _FakeLLMService:
+    def __init__(self):
+        self.calls = 0
+
+    async def refine_email(self, **fields):
+        self.calls += 1
+        return EmailRefineResponse(subject="Hello", body="Shorter body", usage=_USAGE)
+
+
+def _fresh_cache(monkeypatch):
+    monkeypatch.setattr(routes, "_response_cache", routes.ResponseCache(maxsize=8, ttl_seconds=60))
+
+
+def test_cached_generation_reports_zero_usage(monkeypatch):
+    _fresh_cache(monkeypatch)
+    pipeline = _FakePipeline()
+    monkeypatch.setattr(routes, "get_email_pipeline", lambda: pipeline)
+    request = EmailGenerationRequest(
+        purpose=PurposeEnum.FOLLOW_UP, details="Follow up on our meeting", length=LengthEnum.SHORT,
+    )
+
+    first = asyncio.run(routes.generate_email(request))
+    second = asyncio.run(routes.generate_email(request))
+
+    assert pipeline.calls == 1
+    assert first.usage.cost == 0.002
+    assert (second.subject, second.body) == (first.subject, first.body)
+    assert second.usage == UsageInfo()
+    # Zeroing the copy leaves the first response's usage untouched
+    assert first.usage.cost == 0.002
+
+
+def test_cached_refinement_reports_zero_usage(monkeypatch):
+    _fresh_cache(monkeypatch)
+    service = _FakeLLMService()
+    monkeypatch.setattr(routes, "get_llm_service", lambda: service)
+    request = EmailRefineRequest(original_subject="Hello", original_body="Body", feedback="Make it shorter")
+
+    first = asyncio.run(routes.refine_email(request))
+    second = asyncio.run(routes.refine_email(request))
+
+    assert service.calls == 1
+    assert first.usage.cost == 0.002
+    assert second.usage.cost == 0
+    assert second.usage.total_tokens == 0